@@ -200,6 +200,19 @@ def mock_transport():
     return MockL1Transport()
 
 
+@pytest.fixture(scope="module")
+def shared_aesgcm():
+    """Provide a single mock AES-GCM cipher shared across a test module.
+
+    MockAESGCM keeps no state between calls, so one instance can serve
+    as both encrypt and decrypt key for every test in the module.
+
+    Returns:
+        MockAESGCM instance
+    """
+    return MockAESGCM()
+
+
 @pytest.fixture
 def mock_crypto():
     """Provide mock crypto operations for testing.
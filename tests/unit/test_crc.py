@@ -113,6 +113,32 @@ class TestCRC16:
         assert CRC.crc16(data) == result
 
 
+class TestCRC16Incremental:
+    """Test cases for incremental CRC16 calculation."""
+
+    def test_crc16_update_initial_state(self):
+        """Test that update without data returns the initial value."""
+        assert CRC.crc16_update(b'') == CRC.CRC16_INITIAL_VAL
+
+    def test_crc16_update_split_matches_one_shot(self):
+        """Test that feeding data in pieces matches a single call."""
+        data = bytes(range(64))
+        for split in (0, 1, 2, 31, 63, 64):
+            crc = CRC.crc16_update(data[:split])
+            crc = CRC.crc16_update(data[split:], crc)
+            assert CRC.crc16_final(crc) == CRC.crc16(data)
+
+    def test_crc16_final_byte_order(self):
+        """Test that final value is returned little-endian."""
+        assert CRC.crc16_final(0x1234) == b'\x34\x12'
+
+    def test_crc16_into_matches_final(self):
+        """Test that writing into a buffer matches crc16_final."""
+        buf = bytearray(b'\xaa' * 5)
+        CRC.crc16_into(buf, 2, 0x1234)
+        assert buf == b'\xaa\xaa' + CRC.crc16_final(0x1234) + b'\xaa'
+
+
 class TestCRC16Internal:
     """Test cases for internal CRC16 helper method."""
 
@@ -158,3 +184,34 @@ class TestCRC16Constants:
     def test_crc16_final_xor_value(self):
         """Test CRC16 final XOR value."""
         assert CRC.CRC16_FINAL_XOR_VALUE == 0x0000
+
+
+class TestCRC16Table:
+    """Test the table-driven CRC16 against the bitwise reference."""
+
+    @staticmethod
+    def _reference(data):
+        crc = CRC.CRC16_INITIAL_VAL
+        for byte in data:
+            crc = CRC._crc16_byte(byte, crc)
+        return bytes([crc & 0xFF, crc >> 8])
+
+    def test_crc16_table_size(self):
+        """Test that the lookup tables cover every byte value."""
+        assert len(CRC._CRC16_TABLE_HI) == 256
+        assert len(CRC._CRC16_TABLE_LO) == 256
+
+    def test_crc16_check_value(self):
+        """Test the standard CRC-16/BUYPASS check value for "123456789"."""
+        assert CRC.crc16(b'123456789') == b'\xe8\xfe'
+
+    @pytest.mark.parametrize("data", [
+        b'',
+        b'\x00',
+        b'\x01\x02\x03\x04',
+        bytes(range(256)),
+        b'\xff' * 130,
+    ])
+    def test_crc16_matches_bitwise_reference(self, data):
+        """Test that table lookup matches the per-bit algorithm."""
+        assert CRC.crc16(data) == self._reference(data)
@@ -119,6 +119,19 @@ class TestBuildRequest:
         assert request == req_id + expected_crc
 
 
+    def test_build_request_with_payload_len(self):
+        """Test length byte is inserted between request ID and payload."""
+        transport = MockL1Transport()
+        l2 = L2Protocol(transport)
+
+        req_id = b'\x04'
+        payload = memoryview(b'\x10\x11\x12')
+        request = l2._build_request(req_id, payload, payload_len=True)
+
+        expected_data = req_id + b'\x03' + b'\x10\x11\x12'
+        assert request == expected_data + CRC.crc16(expected_data)
+
+
 class TestSendAndGetResponse:
     """Test _send_and_get_response() helper method."""
 
@@ -147,6 +160,34 @@ class TestSendAndGetResponse:
         assert transport.get_response_calls == 1
 
 
+class TestCachedRequest:
+    """Test _cached_request() private method."""
+
+    def test_cached_request_matches_build_request(self):
+        """Test that cached frame equals a freshly built one."""
+        l2 = L2Protocol(MockL1Transport())
+
+        request = l2._cached_request(REQ_ID_GET_INFO_REQ, b'\x01\x00')
+
+        assert request == l2._build_request(REQ_ID_GET_INFO_REQ, b'\x01\x00')
+
+    def test_cached_request_reused_across_instances(self):
+        """Test that the same frame object is returned on repeated calls."""
+        first = L2Protocol(MockL1Transport())._cached_request(REQ_ID_GET_LOG_REQ)
+        second = L2Protocol(MockL1Transport())._cached_request(REQ_ID_GET_LOG_REQ)
+
+        assert first is second
+
+    def test_cached_request_keyed_by_payload(self):
+        """Test that different payloads produce different frames."""
+        l2 = L2Protocol(MockL1Transport())
+
+        chunk0 = l2._cached_request(REQ_ID_GET_INFO_REQ, b'\x00\x00')
+        chunk1 = l2._cached_request(REQ_ID_GET_INFO_REQ, b'\x00\x01')
+
+        assert chunk0 != chunk1
+
+
 class TestGetInfoReq:
     """Test get_info_req() method."""
 
@@ -261,6 +302,8 @@ class TestEncryptedCommand:
 
         assert result_ciphertext == response_ciphertext
         assert result_tag == response_tag
+        assert isinstance(result_ciphertext, bytes)
+        assert isinstance(result_tag, bytes)
         assert transport.get_response_calls == 2  # ACK + final response
 
     def test_encrypted_command_multiple_chunks(self):
@@ -293,6 +336,13 @@ class TestEncryptedCommand:
         assert result_tag == response_tag
         assert len(transport.send_request_calls) == num_chunks
 
+        # Each frame carries request ID, chunk length, chunk and CRC
+        l3data = command_size.to_bytes(2, 'little') + command_ciphertext + command_tag
+        for i, frame in enumerate(transport.send_request_calls):
+            chunk = l3data[i * 128:(i + 1) * 128]
+            expected = bytes(REQ_ID_ENCRYPTED_CMD_REQ) + bytes([len(chunk)]) + chunk
+            assert frame == expected + CRC.crc16(expected)
+
     def test_encrypted_command_size_mismatch_raises_error(self):
         """Test that size mismatch in response raises error."""
         transport = MockL1Transport()
@@ -0,0 +1,75 @@
+"""Unit tests for MicroPython port AES-GCM implementation.
+
+ucryptolib is not available on CPython, so it is stubbed with AES-ECB
+from cryptography and results are compared against cryptography AESGCM.
+"""
+
+import importlib
+import sys
+import types
+
+import pytest
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM as RefAESGCM
+
+
+class _EcbAes:
+    """Minimal ucryptolib.aes stand-in, ECB mode only."""
+
+    def __init__(self, key, mode):
+        assert mode == 1
+        self._encryptor = Cipher(algorithms.AES(bytes(key)), modes.ECB()).encryptor()
+
+    def encrypt(self, block):
+        return self._encryptor.update(bytes(block))
+
+
+@pytest.fixture
+def mp_aesgcm(monkeypatch):
+    """MicroPython AESGCM class imported against stubbed ucryptolib."""
+    ucryptolib = types.ModuleType("ucryptolib")
+    ucryptolib.aes = _EcbAes
+    monkeypatch.setitem(sys.modules, "ucryptolib", ucryptolib)
+    monkeypatch.delitem(sys.modules, "tropicsquare.ports.micropython.aesgcm", raising=False)
+    module = importlib.import_module("tropicsquare.ports.micropython.aesgcm")
+    yield module.AESGCM
+    sys.modules.pop("tropicsquare.ports.micropython.aesgcm", None)
+
+
+KEY = bytes(range(32))
+NONCE = bytes(range(100, 112))
+
+
+class TestMicroPythonAesgcm:
+    """Test MicroPython AESGCM against reference implementation."""
+
+    @pytest.mark.parametrize("length", [0, 1, 15, 16, 17, 100])
+    @pytest.mark.parametrize("aad", [b'', b'header', b'A' * 33])
+    def test_encrypt_matches_reference(self, mp_aesgcm, length, aad):
+        """Test ciphertext and tag match cryptography AESGCM."""
+        data = bytes((i * 7) & 0xFF for i in range(length))
+
+        result = mp_aesgcm(KEY).encrypt(NONCE, data, aad)
+
+        assert result == RefAESGCM(KEY).encrypt(NONCE, data, aad)
+
+    @pytest.mark.parametrize("length", [0, 1, 15, 16, 17, 100])
+    def test_decrypt_reference_ciphertext(self, mp_aesgcm, length):
+        """Test decrypt recovers data encrypted by cryptography AESGCM."""
+        data = bytes((i * 5) & 0xFF for i in range(length))
+        encrypted = RefAESGCM(KEY).encrypt(NONCE, data, b'aad')
+
+        assert mp_aesgcm(KEY).decrypt(NONCE, bytearray(encrypted), b'aad') == data
+
+    def test_decrypt_tampered_tag_raises_value_error(self, mp_aesgcm):
+        """Test that modified tag fails authentication."""
+        encrypted = bytearray(RefAESGCM(KEY).encrypt(NONCE, b'data', b''))
+        encrypted[-1] ^= 1
+
+        with pytest.raises(ValueError, match=r"Invalid tag"):
+            mp_aesgcm(KEY).decrypt(NONCE, encrypted, b'')
+
+    def test_invalid_nonce_length_raises_value_error(self, mp_aesgcm):
+        """Test that only 96-bit nonces are accepted."""
+        with pytest.raises(ValueError, match=r"Nonce must be 12 bytes"):
+            mp_aesgcm(KEY).encrypt(b'\x00' * 8, b'data', b'')
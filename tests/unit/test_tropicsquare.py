@@ -13,7 +13,7 @@ This module tests:
 import pytest
 import sys
 from unittest.mock import patch, MagicMock
-from tropicsquare import TropicSquare
+from tropicsquare import TropicSquare, _SecureSession
 from tropicsquare.l2_protocol import L2Protocol
 from tropicsquare.chip_id import ChipId
 from tropicsquare.exceptions import (
@@ -37,14 +37,21 @@ from tropicsquare.constants import (
     CMD_ID_PING,
     CMD_ID_I_CFG_WRITE,
     CMD_ID_RANDOM_VALUE,
+    CMD_ID_R_CFG_ERASE,
+    CMD_ID_R_CFG_WRITE,
     CMD_ID_R_MEMDATA_WRITE,
     CMD_ID_R_MEMDATA_READ,
     CMD_ID_R_MEMDATA_ERASE,
     CMD_ID_ECC_KEY_GENERATE,
     CMD_ID_ECC_KEY_READ,
     CMD_ID_ECC_KEY_ERASE,
+    CMD_ID_ECC_KEY_STORE,
+    CMD_ID_ECDSA_SIGN,
+    CMD_ID_EDDSA_SIGN,
     CMD_ID_MCOUNTER_INIT,
+    CMD_ID_MCOUNTER_UPDATE,
     CMD_ID_MCOUNTER_GET,
+    CMD_ID_MAC_AND_DESTROY,
     MEM_DATA_MAX_SIZE,
     MCOUNTER_MAX,
     MAC_AND_DESTROY_MAX,
@@ -61,6 +68,49 @@ from tropicsquare.config.startup import StartUpConfig
 from tests.conftest import MockL1Transport, MockAESGCM
 
 
+_CERT_CHUNK_IDS = (
+    GET_INFO_DATA_CHUNK_0_127,
+    GET_INFO_DATA_CHUNK_128_255,
+    GET_INFO_DATA_CHUNK_256_383,
+    GET_INFO_DATA_CHUNK_384_511,
+)
+
+
+def _cert_chunks(cert):
+    """Wrap certificate into 10-byte header and split into 128-byte GET_INFO chunks."""
+    header = b'\x00\x00' + len(cert).to_bytes(2, 'big') + b'\x00' * 6
+    full_data = header + cert
+    return tuple(full_data[i*128:(i+1)*128] for i in range(len(_CERT_CHUNK_IDS)))
+
+
+# 400 bytes certificate split into chunks, precomputed once for all tests
+_CERT_DATA = b'CERT' * 100
+_CHUNKS = _cert_chunks(_CERT_DATA)
+_CHUNK_BY_ID = dict(zip(_CERT_CHUNK_IDS, _CHUNKS))
+
+# Certificate containing X25519 public key signature
+_PUBKEY = b'\xAB' * 32
+_PUBKEY_CERT = b'\x00' * 50 + b'\x65\x6e\x03\x21\x00' + _PUBKEY + b'\x00' * 50
+_PUBKEY_CHUNK_BY_ID = dict(zip(_CERT_CHUNK_IDS, _cert_chunks(_PUBKEY_CERT)))
+
+# Data one byte over the memory slot limit
+_OVERSIZED_MEM_DATA = b'X' * (MEM_DATA_MAX_SIZE + 1)
+
+
+@pytest.fixture
+def ts_with_session(shared_aesgcm):
+    """Provide TropicSquare instance with mock session."""
+    from tropicsquare.ports.cpython import TropicSquareCPython
+
+    transport = MockL1Transport()
+    ts = TropicSquareCPython(transport)
+
+    # Set up mock session (stateless mock cipher serves both directions)
+    ts._secure_session = _SecureSession(shared_aesgcm, shared_aesgcm)
+
+    return ts
+
+
 class TestTropicSquareFactoryMethod:
     """Test TropicSquare factory method (__new__)."""
 
@@ -94,20 +144,38 @@ class TestTropicSquareFactoryMethod:
         from tropicsquare.ports.micropython import TropicSquareMicroPython
         assert isinstance(ts, TropicSquareMicroPython)
 
+    def test_factory_memoizes_implementation_class(self, monkeypatch):
+        """Test that platform detection runs only on first instantiation."""
+        import tropicsquare
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        monkeypatch.setattr(tropicsquare, '_IMPL_CLASS', None)
+
+        ts1 = TropicSquare.__new__(TropicSquare, MockL1Transport())
+        assert tropicsquare._IMPL_CLASS is TropicSquareCPython
+
+        # Second call must not look at sys.implementation again
+        with patch('sys.implementation') as mock_impl:
+            mock_impl.name = 'pypy'
+            ts2 = TropicSquare.__new__(TropicSquare, MockL1Transport())
+
+        assert isinstance(ts1, TropicSquareCPython)
+        assert isinstance(ts2, TropicSquareCPython)
+
     @patch('sys.implementation')
-    def test_factory_raises_error_on_unsupported_platform(self, mock_impl):
+    def test_factory_raises_error_on_unsupported_platform(self, mock_impl, monkeypatch):
         """Test that unsupported Python implementation raises error."""
-        # Mock unsupported implementation
+        import tropicsquare
+
+        # Mock unsupported implementation and drop cached detection result
         mock_impl.name = 'pypy'
+        monkeypatch.setattr(tropicsquare, '_IMPL_CLASS', None)
 
         transport = MockL1Transport()
 
-        with pytest.raises(TropicSquareError) as exc_info:
+        with pytest.raises(TropicSquareError, match=r"Unsupported Python implementation.*pypy"):
             TropicSquare.__new__(TropicSquare, transport)
 
-        assert "Unsupported Python implementation" in str(exc_info.value)
-        assert "pypy" in str(exc_info.value)
-
     def test_subclass_instantiation_bypasses_factory(self):
         """Test that subclass instantiation bypasses factory logic."""
         # When instantiating a subclass directly, __new__ should not do factory logic
@@ -159,65 +227,41 @@ class TestTropicSquareProperties:
         """Test that certificate property fetches cert in 4 chunks."""
         from tropicsquare.ports.cpython import TropicSquareCPython
 
-        # Create certificate data:
-        # 10 bytes header + certificate
-        cert_data = b'CERT' * 100  # 400 bytes certificate
-        header = b'\x00\x00' + len(cert_data).to_bytes(2, 'big') + b'\x00' * 6
-        full_data = header + cert_data
-
-        # Split into 4 chunks of 128 bytes each
-        chunk1 = full_data[0:128]
-        chunk2 = full_data[128:256]
-        chunk3 = full_data[256:384]
-        chunk4 = full_data[384:512]
-
-        transport = MockL1Transport(responses=[chunk1, chunk2, chunk3, chunk4])
+        transport = MockL1Transport(responses=list(_CHUNKS))
         ts = TropicSquareCPython(transport)
 
         # Mock L2 get_info_req to return chunks
-        call_count = [0]
-        def mock_get_info(obj_id, chunk_id=GET_INFO_DATA_CHUNK_0_127):
-            idx = call_count[0]
-            call_count[0] += 1
-            return [chunk1, chunk2, chunk3, chunk4][idx]
-
+        mock_get_info = MagicMock(side_effect=_CHUNKS)
         ts._l2.get_info_req = mock_get_info
 
         # Get certificate
         cert = ts.certificate
 
         # Should extract certificate from data (skip 10 byte header)
-        assert cert == cert_data
-        assert call_count[0] == 4
+        assert cert == _CERT_DATA
+        assert mock_get_info.call_count == 4
 
     def test_certificate_property_caches_result(self):
         """Test that certificate property caches result."""
         from tropicsquare.ports.cpython import TropicSquareCPython
 
-        cert_data = b'CERT' * 100
-        header = b'\x00\x00' + len(cert_data).to_bytes(2, 'big') + b'\x00' * 6
-        full_data = header + cert_data
-
         transport = MockL1Transport()
         ts = TropicSquareCPython(transport)
 
-        call_count = [0]
-        def mock_get_info(obj_id, chunk_id=GET_INFO_DATA_CHUNK_0_127):
-            call_count[0] += 1
-            offset = (chunk_id) * 128
-            return full_data[offset:offset+128]
-
+        mock_get_info = MagicMock(
+            side_effect=lambda obj_id, chunk_id=GET_INFO_DATA_CHUNK_0_127: _CHUNK_BY_ID[chunk_id]
+        )
         ts._l2.get_info_req = mock_get_info
 
         # First call
         cert1 = ts.certificate
-        first_call_count = call_count[0]
+        first_call_count = mock_get_info.call_count
 
         # Second call - should use cached value
         cert2 = ts.certificate
 
         assert cert1 == cert2
-        assert call_count[0] == first_call_count  # No additional calls
+        assert mock_get_info.call_count == first_call_count  # No additional calls
 
     def test_public_key_property_extracts_from_certificate(self):
         """Test that public_key extracts key from certificate."""
@@ -240,19 +284,11 @@ class TestTropicSquareProperties:
         """Test that public_key loads certificate if not already cached."""
         from tropicsquare.ports.cpython import TropicSquareCPython
 
-        pubkey = b'\xAB' * 32
-        cert = b'\x00' * 50 + b'\x65\x6e\x03\x21\x00' + pubkey + b'\x00' * 50
-        header = b'\x00\x00' + len(cert).to_bytes(2, 'big') + b'\x00' * 6
-        full_data = header + cert
-
         transport = MockL1Transport()
         ts = TropicSquareCPython(transport)
 
-        def mock_get_info(obj_id, chunk_id=GET_INFO_DATA_CHUNK_0_127):
-            offset = chunk_id * 128
-            return full_data[offset:offset+128]
-
-        ts._l2.get_info_req = mock_get_info
+        ts._l2.get_info_req = \
+            lambda obj_id, chunk_id=GET_INFO_DATA_CHUNK_0_127: _PUBKEY_CHUNK_BY_ID[chunk_id]
 
         # Certificate not loaded yet
         assert ts._certificate is None
@@ -260,7 +296,7 @@ class TestTropicSquareProperties:
         # Get public key - should trigger certificate load
         key = ts.public_key
 
-        assert key == pubkey
+        assert key == _PUBKEY
         assert ts._certificate is not None
 
     def test_public_key_returns_none_if_signature_not_found(self):
@@ -278,6 +314,48 @@ class TestTropicSquareProperties:
 
         assert key is None
 
+    def test_public_key_property_caches_result(self):
+        """Test that public_key is parsed only once."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        transport = MockL1Transport()
+        ts = TropicSquareCPython(transport)
+        ts._certificate = _PUBKEY_CERT
+
+        key1 = ts.public_key
+        # Certificate is not looked at again
+        ts._certificate = b''
+        key2 = ts.public_key
+
+        assert key1 == key2 == _PUBKEY
+
+    def test_public_key_partial_signature_at_end(self):
+        """Test that a truncated signature at the end does not raise."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        cert = b'\x00' * 200 + b'\x65\x6e'
+
+        transport = MockL1Transport()
+        ts = TropicSquareCPython(transport)
+        ts._certificate = cert
+
+        assert ts.public_key is None
+
+    def test_public_key_truncated_after_signature_raises(self):
+        """Test that a marker within 32 bytes of the end raises and is not cached."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        cert = b'\x00' * 200 + b'\x65\x6e\x03\x21\x00' + b'\xAB' * 20
+
+        transport = MockL1Transport()
+        ts = TropicSquareCPython(transport)
+        ts._certificate = cert
+
+        with pytest.raises(TropicSquareError, match=r"Truncated X25519 public key in certificate \(20 of 32 bytes\)"):
+            ts.public_key
+
+        assert ts._public_key is None
+
     def test_chipid_property_returns_parsed_chip_id(self):
         """Test that chip_id property returns parsed ChipId object."""
         from tropicsquare.ports.cpython import TropicSquareCPython
@@ -355,15 +433,7 @@ class TestGetLog:
         transport = MockL1Transport()
         ts = TropicSquareCPython(transport)
 
-        call_count = [0]
-        def mock_get_log():
-            if call_count[0] < len(log_parts):
-                part = log_parts[call_count[0]]
-                call_count[0] += 1
-                return part
-            return b''
-
-        ts._l2.get_log = mock_get_log
+        ts._l2.get_log = MagicMock(side_effect=log_parts)
 
         log = ts.get_log()
 
@@ -436,6 +506,74 @@ class TestAbstractMethods:
             ts._aesgcm(b'\x00' * 32)
 
 
+class TestWipe:
+    """Test _wipe() secret clearing helper."""
+
+    def test_wipe_zeroes_bytearray(self):
+        """Test that bytearray buffers are overwritten with zeros."""
+        from tropicsquare import _wipe
+
+        first = bytearray(b'\xAA' * 32)
+        second = bytearray(b'\x55' * 16)
+
+        _wipe(first, second)
+
+        assert first == bytearray(32)
+        assert second == bytearray(16)
+
+    def test_wipe_skips_immutable_and_none(self):
+        """Test that bytes and None are accepted and left alone."""
+        from tropicsquare import _wipe
+
+        secret = b'\xAA' * 32
+        _wipe(secret, None)
+
+        assert secret == b'\xAA' * 32
+
+
+class TestCPythonHkdf:
+    """Test CPython port HKDF against the cryptography implementation."""
+
+    @pytest.mark.parametrize("length", [1, 2])
+    def test_hkdf_matches_cryptography(self, length):
+        """Test _hkdf output equals cryptography HKDF-SHA256."""
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+        from cryptography.hazmat.primitives.hashes import SHA256
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        salt = b'\x11' * 32
+        secret = b'\x22' * 32
+
+        expected = HKDF(algorithm=SHA256(), length=length * 32,
+                        salt=salt, info=None).derive(secret)
+        result = ts._hkdf(salt, secret, length)
+
+        if length > 1:
+            assert b''.join(result) == expected
+        else:
+            assert result == expected
+
+
+class TestCPythonAesgcm:
+    """Test CPython port AES-GCM cipher creation."""
+
+    def test_aesgcm_unaffected_by_wiping_key(self):
+        """Test cipher keeps working after its key buffer is wiped."""
+        from tropicsquare import _wipe
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        key = bytearray(b'\x42' * 32)
+        nonce = b'\x01' * 12
+
+        cipher = ts._aesgcm(key)
+        _wipe(key)
+
+        expected = ts._aesgcm(b'\x42' * 32).encrypt(nonce, b'data', b'')
+        assert cipher.encrypt(nonce, b'data', b'') == expected
+
+
 class TestCallCommand:
     """Test _call_command() method."""
 
@@ -449,11 +587,9 @@ class TestCallCommand:
         # No session established
         assert ts._secure_session is None
 
-        with pytest.raises(TropicSquareNoSession) as exc_info:
+        with pytest.raises(TropicSquareNoSession, match=r"Secure session not started"):
             ts._call_command(b'\x01\x02\x03')
 
-        assert "Secure session not started" in str(exc_info.value)
-
     def test_call_command_encrypts_and_sends(self):
         """Test that _call_command encrypts data and sends via L2."""
         from tropicsquare.ports.cpython import TropicSquareCPython
@@ -464,7 +600,7 @@ class TestCallCommand:
         # Set up mock session with MockAESGCM
         encrypt_key = MockAESGCM()
         decrypt_key = MockAESGCM()
-        ts._secure_session = [encrypt_key, decrypt_key, 0]
+        ts._secure_session = _SecureSession(encrypt_key, decrypt_key)
 
         # Mock L2 encrypted_command to return response
         response_data = bytes([CMD_RESULT_OK]) + b'response_data'
@@ -487,20 +623,47 @@ class TestCallCommand:
         # Set up mock session
         encrypt_key = MockAESGCM()
         decrypt_key = MockAESGCM()
-        ts._secure_session = [encrypt_key, decrypt_key, 5]
+        ts._secure_session = _SecureSession(encrypt_key, decrypt_key, bytearray((5).to_bytes(12, "little")))
 
         # Mock L2 encrypted_command
         response_data = bytes([CMD_RESULT_OK]) + b'data'
         ts._l2.encrypted_command = lambda size, ciphertext, tag: (response_data, b'\x00' * 16)
 
         # Counter should be 5
-        assert ts._secure_session[2] == 5
+        assert ts._secure_session.nonce == (5).to_bytes(12, "little")
 
         # Call command
         ts._call_command(b'\x01')
 
         # Counter should be incremented to 6
-        assert ts._secure_session[2] == 6
+        assert ts._secure_session.nonce == (6).to_bytes(12, "little")
+
+    def test_call_command_reuses_session_ciphers(self):
+        """Test that _call_command does not create new ciphers per command."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        ts._secure_session = _SecureSession(MockAESGCM(), MockAESGCM())
+        ts._l2.encrypted_command = lambda size, ciphertext, tag: (bytes([CMD_RESULT_OK]), b'\x00' * 16)
+        ts._aesgcm = MagicMock()
+
+        ts._call_command(b'\x01')
+        ts._call_command(b'\x02')
+
+        ts._aesgcm.assert_not_called()
+
+    def test_call_command_counter_carries(self):
+        """Test that nonce counter carries into the next byte."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        nonce = bytearray((0x01FF).to_bytes(12, "little"))
+        ts._secure_session = _SecureSession(MockAESGCM(), MockAESGCM(), nonce)
+        ts._l2.encrypted_command = lambda size, ciphertext, tag: (bytes([CMD_RESULT_OK]), b'\x00' * 16)
+
+        ts._call_command(b'\x01')
+
+        assert nonce == (0x0200).to_bytes(12, "little")
 
     def test_call_command_raises_error_on_cmd_result_fail(self):
         """Test that _call_command raises error on CMD_RESULT_FAIL."""
@@ -512,7 +675,7 @@ class TestCallCommand:
         # Set up mock session
         encrypt_key = MockAESGCM()
         decrypt_key = MockAESGCM()
-        ts._secure_session = [encrypt_key, decrypt_key, 0]
+        ts._secure_session = _SecureSession(encrypt_key, decrypt_key)
 
         # Mock L2 to return FAIL result
         response_data = bytes([CMD_RESULT_FAIL]) + b'data'
@@ -526,15 +689,9 @@ class TestCallCommand:
 class TestAbortSecureSession:
     """Test abort_secure_session() method."""
 
-    def test_abort_secure_session_clears_session(self):
+    def test_abort_secure_session_clears_session(self, ts_with_session):
         """Test that abort_secure_session clears session."""
-        from tropicsquare.ports.cpython import TropicSquareCPython
-
-        transport = MockL1Transport()
-        ts = TropicSquareCPython(transport)
-
-        # Set up mock session
-        ts._secure_session = [MockAESGCM(), MockAESGCM(), 0]
+        ts = ts_with_session
 
         # Mock L2 encrypted_session_abt
         ts._l2.encrypted_session_abt = lambda: True
@@ -544,14 +701,9 @@ class TestAbortSecureSession:
         assert result is True
         assert ts._secure_session is None
 
-    def test_abort_secure_session_returns_false_on_failure(self):
+    def test_abort_secure_session_returns_false_on_failure(self, ts_with_session):
         """Test that abort_secure_session returns False on failure."""
-        from tropicsquare.ports.cpython import TropicSquareCPython
-
-        transport = MockL1Transport()
-        ts = TropicSquareCPython(transport)
-
-        ts._secure_session = [MockAESGCM(), MockAESGCM(), 0]
+        ts = ts_with_session
 
         # Mock L2 to return False
         ts._l2.encrypted_session_abt = lambda: False
@@ -594,11 +746,9 @@ class TestPowerModeWrappers:
         transport = MockL1Transport()
         ts = TropicSquareCPython(transport)
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Invalid startup mode"):
             ts.reboot(0xFF)
 
-        assert "Invalid startup mode" in str(exc_info.value)
-
     @pytest.mark.parametrize("mode", [SLEEP_MODE_SLEEP, SLEEP_MODE_DEEP_SLEEP])
     def test_sleep_calls_l2_sleep_req(self, mode):
         """Test sleep forwards mode to _l2.sleep_req."""
@@ -627,31 +777,23 @@ class TestPowerModeWrappers:
         transport = MockL1Transport()
         ts = TropicSquareCPython(transport)
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Invalid sleep mode"):
             ts.sleep(0xFF)
 
-        assert "Invalid sleep mode" in str(exc_info.value)
-
 
 class TestL3Commands:
     """Test L3 command methods."""
 
     @pytest.fixture
-    def ts_with_session(self):
-        """Provide TropicSquare instance with mock session."""
-        from tropicsquare.ports.cpython import TropicSquareCPython
-
-        transport = MockL1Transport()
-        ts = TropicSquareCPython(transport)
-
-        # Set up mock session
-        encrypt_key = MockAESGCM()
-        decrypt_key = MockAESGCM()
-        ts._secure_session = [encrypt_key, decrypt_key, 0]
+    def ts_with_session(self, ts_with_session):
+        """Extend session-ready TropicSquare with mocked L2 encrypted_command."""
+        ts = ts_with_session
 
         # Mock L2 encrypted_command
         ts.response_data = None
         def mock_encrypted_command(size, ciphertext, tag):
+            # Mock cipher leaves plaintext as is, keep it for layout checks
+            ts.last_request = bytes(ciphertext)
             # Return mock response (ciphertext, tag)
             # decrypt() will concatenate them and remove last 16 bytes
             if ts.response_data:
@@ -673,6 +815,7 @@ class TestL3Commands:
         result = ts.ping(ping_data)
 
         assert result == ping_data
+        assert ts.last_request == bytes([CMD_ID_PING]) + ping_data
 
     def test_random_command(self, ts_with_session):
         """Test random command."""
@@ -686,6 +829,21 @@ class TestL3Commands:
 
         # Should strip first 3 bytes after CMD_RESULT
         assert result == random_data
+        assert ts.last_request == bytes([CMD_ID_RANDOM_VALUE, 5])
+
+    @pytest.mark.parametrize("nbytes", [-1, 256])
+    def test_random_validates_nbytes(self, ts_with_session, nbytes):
+        """Test that random rejects byte counts not fitting one byte."""
+        with pytest.raises(ValueError, match=r"Number of random bytes must be in range 0-255"):
+            ts_with_session.random(nbytes)
+
+    def test_r_config_erase_command(self, ts_with_session):
+        """Test r_config_erase sends bare command id."""
+        ts = ts_with_session
+        ts.response_data = bytes([CMD_RESULT_OK])
+
+        assert ts.r_config_erase() is True
+        assert ts.last_request == bytes([CMD_ID_R_CFG_ERASE])
 
     def test_mem_data_write_command(self, ts_with_session):
         """Test mem_data_write command."""
@@ -700,17 +858,96 @@ class TestL3Commands:
 
         assert result is True
 
+    def test_request_layouts(self, ts_with_session):
+        """Test fixed-layout requests are packed byte-exact."""
+        ts = ts_with_session
+        ts.response_data = bytes([CMD_RESULT_OK]) + bytes(80)
+
+        ts.mem_data_write(b'data', 0x0102)
+        assert ts.last_request == bytes([CMD_ID_R_MEMDATA_WRITE, 0x02, 0x01]) + b'M' + b'data'
+
+        ts.ecc_key_store(3, ECC_CURVE_P256, b'\x11' * 32)
+        assert ts.last_request == bytes([CMD_ID_ECC_KEY_STORE, 3, 0, ECC_CURVE_P256]) + bytes(12) + b'\x11' * 32
+
+        ts.ecdsa_sign(5, b'\x22' * 32)
+        assert ts.last_request == bytes([CMD_ID_ECDSA_SIGN, 5, 0]) + bytes(13) + b'\x22' * 32
+
+        ts.eddsa_sign(6, b'msg')
+        assert ts.last_request == bytes([CMD_ID_EDDSA_SIGN, 6, 0]) + bytes(13) + b'msg'
+
+        ts.mcounter_init(2, 0x01020304)
+        assert ts.last_request == bytes([CMD_ID_MCOUNTER_INIT, 2, 0]) + b'A' + b'\x04\x03\x02\x01'
+
+        ts.mcounter_update(2)
+        assert ts.last_request == bytes([CMD_ID_MCOUNTER_UPDATE, 2, 0])
+
+        ts.mac_and_destroy(7, b'X' * 32)
+        assert ts.last_request == bytes([CMD_ID_MAC_AND_DESTROY, 7, 0]) + b'M' + b'X' * 32
+
+        ts.mem_data_erase(0x0203)
+        assert ts.last_request == bytes([CMD_ID_R_MEMDATA_ERASE, 0x03, 0x02])
+
+        ts.ecc_key_generate(4, ECC_CURVE_P256)
+        assert ts.last_request == bytes([CMD_ID_ECC_KEY_GENERATE, 4, 0, ECC_CURVE_P256])
+
+        ts.r_config_write(CFG_START_UP, 0x11223344)
+        assert ts.last_request == (
+            bytes([CMD_ID_R_CFG_WRITE]) + CFG_START_UP.to_bytes(2, "little") + b'M' + b'\x44\x33\x22\x11'
+        )
+
+    @pytest.mark.parametrize("slot", [-1, 0x10000])
+    @pytest.mark.parametrize("call", [
+        lambda ts, slot: ts.mem_data_read(slot),
+        lambda ts, slot: ts.mem_data_write(b'data', slot),
+        lambda ts, slot: ts.mem_data_erase(slot),
+    ])
+    def test_slot_out_of_field_range_raises_value_error(self, ts_with_session, call, slot):
+        """Test that memory slots not fitting the 16-bit field are rejected before packing."""
+        with pytest.raises(ValueError, match=r"Slot must be in range 0-65535"):
+            call(ts_with_session, slot)
+
+    @pytest.mark.parametrize("slot", [-1, 0x10000])
+    @pytest.mark.parametrize("call", [
+        lambda ts, slot: ts.ecc_key_generate(slot, ECC_CURVE_P256),
+        lambda ts, slot: ts.ecc_key_store(slot, ECC_CURVE_P256, b'\x01' * 32),
+        lambda ts, slot: ts.ecc_key_read(slot),
+        lambda ts, slot: ts.ecc_key_erase(slot),
+        lambda ts, slot: ts.ecdsa_sign(slot, b'\x01' * 32),
+        lambda ts, slot: ts.eddsa_sign(slot, b'message'),
+    ])
+    def test_ecc_slot_out_of_range_raises_value_error(self, ts_with_session, call, slot):
+        """Test that ECC methods reject negative and too large slots."""
+        with pytest.raises(ValueError, match=r"Slot is larger than ECC_MAX_KEYS"):
+            call(ts_with_session, slot)
+
+    @pytest.mark.parametrize("slot", [-1, 0x10000])
+    def test_mac_and_destroy_slot_out_of_range_raises_value_error(self, ts_with_session, slot):
+        """Test that mac_and_destroy rejects negative and too large slots."""
+        with pytest.raises(ValueError, match=r"exceeds maximum MAC_AND_DESTROY_MAX"):
+            ts_with_session.mac_and_destroy(slot, b'X' * 32)
+
+    @pytest.mark.parametrize("call", [
+        lambda ts: ts.mcounter_init(-1, 0),
+        lambda ts: ts.mcounter_update(-1),
+        lambda ts: ts.mcounter_get(-1),
+    ])
+    def test_mcounter_negative_index_raises_value_error(self, ts_with_session, call):
+        """Test that negative counter index is rejected before packing."""
+        with pytest.raises(ValueError, match=r"Index must not be negative"):
+            call(ts_with_session)
+
+    @pytest.mark.parametrize("value", [-1, 0x100000000])
+    def test_mcounter_init_value_out_of_range_raises_value_error(self, ts_with_session, value):
+        """Test that counter value must fit 32 bits."""
+        with pytest.raises(ValueError, match=r"Counter value must be 32-bit unsigned integer"):
+            ts_with_session.mcounter_init(0, value)
+
     def test_mem_data_write_validates_size(self, ts_with_session):
         """Test that mem_data_write validates data size."""
         ts = ts_with_session
 
-        # Data larger than MEM_DATA_MAX_SIZE
-        large_data = b'X' * (MEM_DATA_MAX_SIZE + 1)
-
-        with pytest.raises(ValueError) as exc_info:
-            ts.mem_data_write(large_data, 0)
-
-        assert "exceeds maximum allowed size" in str(exc_info.value)
+        with pytest.raises(ValueError, match="exceeds maximum allowed size"):
+            ts.mem_data_write(_OVERSIZED_MEM_DATA, 0)
 
     def test_mem_data_read_command(self, ts_with_session):
         """Test mem_data_read command."""
@@ -748,20 +985,16 @@ class TestL3Commands:
         """Test that ecc_key_generate validates slot."""
         ts = ts_with_session
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Slot is larger than ECC_MAX_KEYS"):
             ts.ecc_key_generate(ECC_MAX_KEYS + 1, ECC_CURVE_P256)
 
-        assert "Slot is larger than ECC_MAX_KEYS" in str(exc_info.value)
-
     def test_ecc_key_generate_validates_curve(self, ts_with_session):
         """Test that ecc_key_generate validates curve."""
         ts = ts_with_session
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Invalid curve"):
             ts.ecc_key_generate(0, 0xFF)
 
-        assert "Invalid curve" in str(exc_info.value)
-
     def test_ecc_key_read_command(self, ts_with_session):
         """Test ecc_key_read command."""
         ts = ts_with_session
@@ -803,11 +1036,9 @@ class TestL3Commands:
         """Test that mcounter_init validates index."""
         ts = ts_with_session
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Index is larger than MCOUNTER_MAX"):
             ts.mcounter_init(MCOUNTER_MAX + 1, 100)
 
-        assert "Index is larger than MCOUNTER_MAX" in str(exc_info.value)
-
     def test_mcounter_get_command(self, ts_with_session):
         """Test mcounter_get command."""
         ts = ts_with_session
@@ -889,20 +1120,16 @@ class TestL3Commands:
         """Test that ecc_key_store validates slot."""
         ts = ts_with_session
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Slot is larger than ECC_MAX_KEYS"):
             ts.ecc_key_store(ECC_MAX_KEYS + 1, ECC_CURVE_P256, b'\x01' * 32)
 
-        assert "Slot is larger than ECC_MAX_KEYS" in str(exc_info.value)
-
     def test_ecc_key_store_validates_curve(self, ts_with_session):
         """Test that ecc_key_store validates curve."""
         ts = ts_with_session
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Invalid curve"):
             ts.ecc_key_store(0, 0xFF, b'\x01' * 32)  # Invalid curve
 
-        assert "Invalid curve" in str(exc_info.value)
-
     def test_ecdsa_sign_command(self, ts_with_session):
         """Test ecdsa_sign command execution."""
         ts = ts_with_session
@@ -923,11 +1150,9 @@ class TestL3Commands:
         """Test that ecdsa_sign validates slot."""
         ts = ts_with_session
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Slot is larger than ECC_MAX_KEYS"):
             ts.ecdsa_sign(ECC_MAX_KEYS + 1, b'\x01' * 32)
 
-        assert "Slot is larger than ECC_MAX_KEYS" in str(exc_info.value)
-
     def test_eddsa_sign_command(self, ts_with_session):
         """Test eddsa_sign command execution."""
         ts = ts_with_session
@@ -948,11 +1173,9 @@ class TestL3Commands:
         """Test that eddsa_sign validates slot."""
         ts = ts_with_session
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Slot is larger than ECC_MAX_KEYS"):
             ts.eddsa_sign(ECC_MAX_KEYS + 1, b'message')
 
-        assert "Slot is larger than ECC_MAX_KEYS" in str(exc_info.value)
-
     def test_mcounter_update_command(self, ts_with_session):
         """Test mcounter_update command execution."""
         ts = ts_with_session
@@ -968,11 +1191,9 @@ class TestL3Commands:
         """Test that mcounter_update validates index."""
         ts = ts_with_session
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"Index is larger than MCOUNTER_MAX"):
             ts.mcounter_update(MCOUNTER_MAX + 1)
 
-        assert "Index is larger than MCOUNTER_MAX" in str(exc_info.value)
-
     def test_mac_and_destroy_command(self, ts_with_session):
         """Test mac_and_destroy command execution."""
         ts = ts_with_session
@@ -1084,7 +1305,173 @@ class TestStartSecureSession:
         ts._l2.handshake_req = lambda ehpub, pkey_idx: (tsehpub, tsauth)
 
         # Try to start session - should fail on auth tag mismatch
-        with pytest.raises(TropicSquareHandshakeError) as exc_info:
+        with pytest.raises(TropicSquareHandshakeError, match=r"Authentication tag mismatch"):
+            ts.start_secure_session(0, b'\x03' * 32, b'\x04' * 32)
+
+    @staticmethod
+    def _capture_secrets(ts):
+        """Wrap port primitives of ts, returns list filled with their secret outputs."""
+        captured = []
+        get_ephemeral_keypair = ts._get_ephemeral_keypair
+        x25519_exchange = ts._x25519_exchange
+        hkdf = ts._hkdf
+
+        def capture_keypair():
+            priv, pub = get_ephemeral_keypair()
+            captured.append(priv)
+            return priv, pub
+
+        def capture_exchange(private_bytes, public_bytes):
+            shared = x25519_exchange(private_bytes, public_bytes)
+            captured.append(shared)
+            return shared
+
+        def capture_hkdf(salt, shared_secret, length=1):
+            result = hkdf(salt, shared_secret, length)
+            captured.extend(result if length > 1 else [result])
+            return result
+
+        ts._get_ephemeral_keypair = capture_keypair
+        ts._x25519_exchange = capture_exchange
+        ts._hkdf = capture_hkdf
+        return captured
+
+    def test_start_secure_session_wipes_secrets_on_failure(self):
+        """Test that handshake secrets are zeroed when auth tag mismatches."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        ts._certificate = _PUBKEY_CERT
+        ts._l2.handshake_req = lambda ehpub, pkey_idx: (b'\x02' * 32, b'\xFF' * 16)
+        captured = self._capture_secrets(ts)
+
+        with pytest.raises(TropicSquareHandshakeError):
             ts.start_secure_session(0, b'\x03' * 32, b'\x04' * 32)
 
-        assert "Authentication tag mismatch" in str(exc_info.value)
+        # ehpriv, 3 shared secrets, 6 HKDF outputs
+        assert len(captured) == 10
+        for secret in captured:
+            assert isinstance(secret, bytearray)
+            assert secret == bytearray(32)
+
+    def test_start_secure_session_wipes_ephemeral_key_when_handshake_req_fails(self):
+        """Test that ephemeral private key is zeroed when L2 handshake raises."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        ts._certificate = _PUBKEY_CERT
+        ts._l2.handshake_req = MagicMock(side_effect=TropicSquareHandshakeError("chip error"))
+        captured = self._capture_secrets(ts)
+
+        with pytest.raises(TropicSquareHandshakeError, match=r"chip error"):
+            ts.start_secure_session(0, b'\x03' * 32, b'\x04' * 32)
+
+        assert len(captured) == 1
+        assert captured[0] == bytearray(32)
+
+    def test_start_secure_session_wipes_secrets_when_derivation_fails(self):
+        """Test that secrets created before a failing HKDF step are zeroed."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        ts._certificate = _PUBKEY_CERT
+        ts._l2.handshake_req = lambda ehpub, pkey_idx: (b'\x02' * 32, b'\x00' * 16)
+        captured = self._capture_secrets(ts)
+
+        hkdf = ts._hkdf
+        def failing_hkdf(salt, shared_secret, length=1):
+            if length == 2:
+                raise RuntimeError("hkdf failed")
+            return hkdf(salt, shared_secret, length)
+        ts._hkdf = failing_hkdf
+
+        with pytest.raises(RuntimeError, match=r"hkdf failed"):
+            ts.start_secure_session(0, b'\x03' * 32, b'\x04' * 32)
+
+        # ehpriv, 3 shared secrets, 2 HKDF outputs
+        assert len(captured) == 6
+        for secret in captured:
+            assert secret == bytearray(32)
+
+    def test_start_secure_session_wipes_secrets_on_success(self):
+        """Test that handshake secrets are zeroed once session keys are set up."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        ts._certificate = _PUBKEY_CERT
+        ts._l2.handshake_req = lambda ehpub, pkey_idx: (b'\x02' * 32, b'\x00' * 16)
+        captured = self._capture_secrets(ts)
+
+        aesgcm = MagicMock()
+        aesgcm.encrypt.return_value = b'\x00' * 16
+        ts._aesgcm = MagicMock(return_value=aesgcm)
+
+        assert ts.start_secure_session(0, b'\x03' * 32, b'\x04' * 32) is True
+
+        assert len(captured) == 10
+        for secret in captured:
+            assert isinstance(secret, bytearray)
+            assert secret == bytearray(32)
+
+    def test_handshake_hash_prefix_matches_full_chain(self):
+        """Test cached hash prefix equals chained SHA256 over static keys."""
+        from hashlib import sha256
+        from tropicsquare.constants import PROTOCOL_NAME
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        ts._certificate = _PUBKEY_CERT
+        shpub = b'\x04' * 32
+
+        expected = sha256(PROTOCOL_NAME).digest()
+        expected = sha256(expected + shpub).digest()
+        expected = sha256(expected + _PUBKEY).digest()
+
+        assert ts._get_handshake_hash_prefix(shpub) == expected
+
+    def test_handshake_hash_prefix_cached_per_pairing_key(self):
+        """Test hash prefix is reused for same key and recomputed for another."""
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        ts._certificate = _PUBKEY_CERT
+
+        first = ts._get_handshake_hash_prefix(b'\x04' * 32)
+        assert ts._get_handshake_hash_prefix(b'\x04' * 32) is first
+
+        other = ts._get_handshake_hash_prefix(b'\x05' * 32)
+        assert other != first
+
+    def test_start_secure_session_transcript_hash(self, mock_crypto):
+        """Test handshake tag is computed over the chained Noise transcript hash."""
+        from hashlib import sha256
+        from tropicsquare.constants import PROTOCOL_NAME
+        from tropicsquare.ports.cpython import TropicSquareCPython
+
+        ts = TropicSquareCPython(MockL1Transport())
+        ts._certificate = _PUBKEY_CERT
+        ts._get_ephemeral_keypair = mock_crypto.mock_get_ephemeral_keypair
+        ts._x25519_exchange = mock_crypto.mock_x25519_exchange
+        ts._hkdf = mock_crypto.mock_hkdf
+
+        aesgcm = MagicMock()
+        aesgcm.encrypt.return_value = b'\x00' * 16
+        ts._aesgcm = MagicMock(return_value=aesgcm)
+
+        tsehpub = b'\x05' * 32
+        ts._l2.handshake_req = MagicMock(return_value=(tsehpub, b'\x00' * 16))
+
+        shpub = b'\x06' * 32
+        assert ts.start_secure_session(1, b'\x07' * 32, shpub) is True
+
+        # Each transcript element is hashed in its own step, never fused
+        expected = sha256(PROTOCOL_NAME).digest()
+        for element in (shpub, _PUBKEY, b'\x02' * 32, b'\x01', tsehpub):
+            expected = sha256(expected + element).digest()
+
+        aad = aesgcm.encrypt.call_args.kwargs["associated_data"]
+        assert aad == expected
+
+        # New session starts with zero nonce
+        assert isinstance(ts._secure_session, _SecureSession)
+        assert ts._secure_session.nonce == bytes(12)
@@ -19,6 +19,94 @@ from tropicsquare.ecc import EccKeyInfo
 from tropicsquare.ecc.signature import EcdsaSignature, EddsaSignature
 
 from hashlib import sha256
+import struct
+
+
+# Platform-specific implementation class, resolved on first instantiation
+_IMPL_CLASS = None
+
+# X509 certificate is read in four 128 byte chunks
+_CERT_CHUNKS = (
+    GET_INFO_DATA_CHUNK_0_127,
+    GET_INFO_DATA_CHUNK_128_255,
+    GET_INFO_DATA_CHUNK_256_383,
+    GET_INFO_DATA_CHUNK_384_511,
+)
+_CERT_BUFFER_SIZE = 512
+
+# First handshake hash step, depends only on the protocol name
+_PROTOCOL_NAME_SHA256 = sha256(PROTOCOL_NAME).digest()
+
+# Tag preceding X25519 public key in the certificate
+_X25519_PUBKEY_MARKER = b'\x65\x6e\x03\x21'
+
+# Handshake auth tag is computed with all-zero AES-GCM nonce
+_ZERO_NONCE_12 = bytes(12)
+
+# Accepted argument values, tuples as frozenset is optional on MicroPython
+_STARTUP_MODES = (STARTUP_REBOOT, STARTUP_MAINTENANCE_REBOOT)
+_SLEEP_MODES = (SLEEP_MODE_SLEEP, SLEEP_MODE_DEEP_SLEEP)
+_ECC_CURVES = (ECC_CURVE_P256, ECC_CURVE_ED25519)
+
+# Fixed-layout L3 request headers (command id, little-endian slot, index or
+# config address, padding), the variable-length payload is appended after packing
+_REQ_SLOT = "<BH"
+_REQ_SLOT_BYTE = "<BHB"
+_REQ_SLOT_PADDED = "<BH1s"
+_REQ_ECC_KEY_STORE = "<BHB12s"
+_REQ_SIGN = "<BH13s"
+_REQ_MCOUNTER_INIT = "<BH1sI"
+# Largest slot that fits the "H" field of the formats above
+_SLOT_MAX = 0xFFFF
+_PAD_M = b'M'
+_PAD_A = b'A'
+_PAD_12 = bytes(12)
+_PAD_13 = bytes(13)
+_REQ_R_CFG_ERASE = bytes((CMD_ID_R_CFG_ERASE,))
+
+
+def _mix_hash(h: bytes, data: bytes) -> bytes:
+    """Mix data into handshake hash, returns SHA256(h || data)"""
+    hasher = sha256(h)
+    hasher.update(data)
+    return hasher.digest()
+
+
+def _increment_nonce(nonce: bytearray) -> None:
+    """Increment little-endian nonce counter in place"""
+    for i in range(len(nonce)):
+        nonce[i] = (nonce[i] + 1) & 0xFF
+        if nonce[i]:
+            break
+
+
+def _wipe(*buffers) -> None:
+    """Overwrite mutable buffers with zeros
+
+    Immutable objects (bytes) can not be cleared in place and are skipped,
+    they can be only dropped.
+    """
+    for buf in buffers:
+        if isinstance(buf, bytearray):
+            for i in range(len(buf)):
+                buf[i] = 0
+
+
+class _SecureSession:
+    """State of established secure session"""
+    __slots__ = ("enc", "dec", "nonce")
+
+    def __init__(self, enc, dec, nonce=None):
+        """Create session state.
+
+            :param enc: AES-GCM cipher for commands
+            :param dec: AES-GCM cipher for responses
+            :param nonce: Starting nonce, defaults to zero
+        """
+        self.enc = enc
+        self.dec = dec
+        # Little-endian counter, incremented in place per command
+        self.nonce = bytearray(12) if nonce is None else nonce
 
 
 class TropicSquare:
@@ -27,26 +115,31 @@ class TropicSquare:
 
         When instantiating TropicSquare directly, automatically returns
         either TropicSquareCPython or TropicSquareMicroPython based on
-        the detected platform.
+        the detected platform. The detected class is cached, so platform
+        detection and port import happen only once.
 
         This allows users to write platform-agnostic code:
             from tropicsquare import TropicSquare
             ts = TropicSquare(transport)
         """
+        global _IMPL_CLASS
+
         if cls is not TropicSquare:
             return super().__new__(cls)
 
         # Only do platform detection when instantiating base class directly
-        import sys
-        if sys.implementation.name == 'micropython':
-            from tropicsquare.ports.micropython import TropicSquareMicroPython
-            return TropicSquareMicroPython(*args, **kwargs)
-
-        if sys.implementation.name == 'cpython':
-            from tropicsquare.ports.cpython import TropicSquareCPython
-            return TropicSquareCPython(*args, **kwargs)
+        if _IMPL_CLASS is None:
+            import sys
+            if sys.implementation.name == 'micropython':
+                from tropicsquare.ports.micropython import TropicSquareMicroPython
+                _IMPL_CLASS = TropicSquareMicroPython
+            elif sys.implementation.name == 'cpython':
+                from tropicsquare.ports.cpython import TropicSquareCPython
+                _IMPL_CLASS = TropicSquareCPython
+            else:
+                raise TropicSquareError("Unsupported Python implementation: {}".format(sys.implementation.name))
 
-        raise TropicSquareError("Unsupported Python implementation: {}".format(sys.implementation.name))
+        return _IMPL_CLASS(*args, **kwargs)
 
 
     def __init__(self, transport: L1Transport) -> None:
@@ -56,6 +149,8 @@ class TropicSquare:
         """
         self._secure_session = None
         self._certificate = None
+        self._public_key = None
+        self._handshake_hash_prefix = None
 
         # Create L2 protocol layer with transport
         self._l2 = L2Protocol(transport)
@@ -71,17 +166,20 @@ class TropicSquare:
         if self._certificate:
             return self._certificate
 
-        data = self._l2.get_info_req(GET_INFO_X509_CERT, GET_INFO_DATA_CHUNK_0_127)
-        data += self._l2.get_info_req(GET_INFO_X509_CERT, GET_INFO_DATA_CHUNK_128_255)
-        data += self._l2.get_info_req(GET_INFO_X509_CERT, GET_INFO_DATA_CHUNK_256_383)
-        data += self._l2.get_info_req(GET_INFO_X509_CERT, GET_INFO_DATA_CHUNK_384_511)
+        # Preallocate whole buffer to avoid growing it chunk by chunk
+        data = bytearray(_CERT_BUFFER_SIZE)
+        offset = 0
+        for chunk_id in _CERT_CHUNKS:
+            chunk = self._l2.get_info_req(GET_INFO_X509_CERT, chunk_id)
+            data[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
 
         # TODO: Figure out what are that 10 bytes at the beginning
         # 2 bytes: unknown
         # 2 bytes (big-endian): length of the certificate
         # 6 bytes: unknown
-        length = int.from_bytes(data[2:4], "big")
-        self._certificate = data[10:10+length]
+        length = struct.unpack_from(">H", data, 2)[0]
+        self._certificate = bytes(data[10:10+length])
         return self._certificate
 
 
@@ -93,24 +191,31 @@ class TropicSquare:
 
             :returns: Public key
             :rtype: bytes
+
+            :raises TropicSquareError: If public key in certificate is truncated
         """
+        if self._public_key:
+            return self._public_key
+
         if self._certificate is None:
             cert = self.certificate
         else :
             cert = self._certificate
 
         # Find signature for X25519 public key
-        # 0x65, 0x6e, 0x03 and 0x21
-        for i in range(len(cert)):
-            if cert[i] == 0x65:
-                if cert[i+1] == 0x6e and \
-                    cert[i+2] == 0x03 and \
-                    cert[i+3] == 0x21:
-                    # Found it
-                    # Plus 5 bytes to skip the signature
-                    return cert[i+5:i+5+32]
+        i = cert.find(_X25519_PUBKEY_MARKER)
+        if i < 0:
+            return None
+
+        # Plus 5 bytes to skip the signature
+        key = cert[i+5:i+5+32]
+        if len(key) != 32:
+            raise TropicSquareError(
+                f"Truncated X25519 public key in certificate ({len(key)} of 32 bytes)"
+            )
 
-        return None
+        self._public_key = key
+        return self._public_key
 
 
     @property
@@ -175,61 +280,66 @@ class TropicSquare:
 
         ehpriv, ehpub = self._get_ephemeral_keypair()
 
-        # Handshake request
-        tsehpub, tsauth = self._l2.handshake_req(ehpub, pkey_index)
-
-        # Calculation magic
-        sha256hash = sha256()
-        sha256hash.update(PROTOCOL_NAME)
+        shared_secret_eh_tseh = shared_secret_sh_tseh = shared_secret_eh_st = None
+        ck_hkdf_eh_tseh = ck_hkdf_sh_tseh = ck_hkdf_cmdres = None
+        kauth = kcmd = kres = None
 
-        sha256hash = sha256(sha256hash.digest())
-        sha256hash.update(shpub)
+        try:
+            # Handshake request
+            tsehpub, tsauth = self._l2.handshake_req(ehpub, pkey_index)
 
-        sha256hash = sha256(sha256hash.digest())
-        sha256hash.update(self.public_key)
+            # Calculation magic
+            hash = _mix_hash(self._get_handshake_hash_prefix(shpub), ehpub)
+            hash = _mix_hash(hash, bytes((pkey_index,)))
+            hash = _mix_hash(hash, tsehpub)
 
-        sha256hash = sha256(sha256hash.digest())
-        sha256hash.update(ehpub)
+            shared_secret_eh_tseh = self._x25519_exchange(ehpriv, tsehpub)
+            shared_secret_sh_tseh = self._x25519_exchange(shpriv, tsehpub)
+            shared_secret_eh_st = self._x25519_exchange(ehpriv, self.public_key)
 
-        sha256hash = sha256(sha256hash.digest())
-        sha256hash.update(pkey_index.to_bytes(1, "little"))
+            ck_hkdf_eh_tseh = self._hkdf(PROTOCOL_NAME, shared_secret_eh_tseh)
+            ck_hkdf_sh_tseh = self._hkdf(ck_hkdf_eh_tseh, shared_secret_sh_tseh)
+            ck_hkdf_cmdres, kauth = self._hkdf(ck_hkdf_sh_tseh, shared_secret_eh_st, 2)
+            kcmd, kres = self._hkdf(ck_hkdf_cmdres, b'', 2)
 
-        sha256hash = sha256(sha256hash.digest())
-        sha256hash.update(tsehpub)
+            ciphertext_with_tag = self._aesgcm(kauth).encrypt(nonce=_ZERO_NONCE_12, data=b'', associated_data=hash)
+            tag = ciphertext_with_tag[-16:]
 
-        hash = sha256hash.digest()
+            if tag != tsauth:
+                raise TropicSquareHandshakeError("Authentication tag mismatch - handshake failed")
 
-        shared_secret_eh_tseh = self._x25519_exchange(ehpriv, tsehpub)
-        shared_secret_sh_tseh = self._x25519_exchange(shpriv, tsehpub)
-        shared_secret_eh_st = self._x25519_exchange(ehpriv, self.public_key)
+            encrypt_key = self._aesgcm(kcmd)
+            decrypt_key = self._aesgcm(kres)
+        finally:
+            # Clear handshake data, also when any step above fails
+            _wipe(ehpriv, shared_secret_eh_tseh, shared_secret_sh_tseh, shared_secret_eh_st,
+                  ck_hkdf_eh_tseh, ck_hkdf_sh_tseh, ck_hkdf_cmdres, kauth, kcmd, kres)
 
-        ck_hkdf_eh_tseh = self._hkdf(PROTOCOL_NAME, shared_secret_eh_tseh)
-        ck_hkdf_sh_tseh = self._hkdf(ck_hkdf_eh_tseh, shared_secret_sh_tseh)
-        ck_hkdf_cmdres, kauth = self._hkdf(ck_hkdf_sh_tseh, shared_secret_eh_st, 2)
-        kcmd, kres = self._hkdf(ck_hkdf_cmdres, b'', 2)
+        self._secure_session = _SecureSession(encrypt_key, decrypt_key)
 
-        ciphertext_with_tag = self._aesgcm(kauth).encrypt(nonce=b'\x00'*12, data=b'', associated_data=hash)
-        tag = ciphertext_with_tag[-16:]
+        return True
 
-        # Clear hanshake data
-        shared_secret_eh_tseh = None
-        shared_secret_sh_tseh = None
-        shared_secret_eh_st = None
 
-        ck_hkdf_eh_tseh = None
-        ck_hkdf_sh_tseh = None
-        ck_hkdf_cmdres = None
-        kauth = None
+    def _get_handshake_hash_prefix(self, shpub: bytes) -> bytes:
+        """Get handshake hash over protocol name and both static public keys
 
-        if tag != tsauth:
-            raise TropicSquareHandshakeError("Authentication tag mismatch - handshake failed")
+            This part of the hash does not depend on ephemeral keys, so it is
+            computed once and reused while pairing and chip keys stay the same.
 
-        encrypt_key = self._aesgcm(kcmd)
-        decrypt_key = self._aesgcm(kres)
+            :param shpub: Pairing public key
 
-        self._secure_session = [ encrypt_key, decrypt_key, 0 ]
+            :returns: Intermediate handshake hash
+            :rtype: bytes
+        """
+        stpub = self.public_key
+        cached = self._handshake_hash_prefix
+        if cached is not None and cached[0] == shpub and cached[1] == stpub:
+            return cached[2]
 
-        return True
+        prefix = _mix_hash(_PROTOCOL_NAME_SHA256, shpub)
+        prefix = _mix_hash(prefix, stpub)
+        self._handshake_hash_prefix = (bytes(shpub), stpub, prefix)
+        return prefix
 
 
     def abort_secure_session(self) -> bool:
@@ -255,7 +365,7 @@ class TropicSquare:
             :raises ValueError: If invalid startup mode
             :raises TropicSquareError: If startup request failed
         """
-        if mode not in [STARTUP_REBOOT, STARTUP_MAINTENANCE_REBOOT]:
+        if mode not in _STARTUP_MODES:
             raise ValueError("Invalid startup mode")
 
         return self._l2.startup_req(mode)
@@ -272,7 +382,7 @@ class TropicSquare:
             :raises ValueError: If invalid sleep mode
             :raises TropicSquareError: If sleep request failed
         """
-        if mode not in [SLEEP_MODE_SLEEP, SLEEP_MODE_DEEP_SLEEP]:
+        if mode not in _SLEEP_MODES:
             raise ValueError("Invalid sleep mode")
 
         return self._l2.sleep_req(mode)
@@ -284,15 +394,16 @@ class TropicSquare:
             :returns: Log message
             :rtype: str
         """
-        log = b''
+        parts = []
+        l2_get_log = self._l2.get_log
         while True:
-            part = self._l2.get_log()
+            part = l2_get_log()
             if not part:
                 break
 
-            log += part
+            parts.append(part)
 
-        return log.decode("utf-8")
+        return b''.join(parts).decode("utf-8")
 
     ###############
     # L3 Commands #
@@ -306,9 +417,7 @@ class TropicSquare:
             :returns: Data from input
             :rtype: bytes
         """
-        request_data = bytearray()
-        request_data.append(CMD_ID_PING)
-        request_data.extend(data)
+        request_data = bytes((CMD_ID_PING,)) + data
 
         result = self._call_command(request_data)
 
@@ -322,10 +431,13 @@ class TropicSquare:
 
             :returns: Random bytes
             :rtype: bytes
+
+            :raises ValueError: If nbytes is not in range 0-255
         """
-        request_data = bytearray()
-        request_data.append(CMD_ID_RANDOM_VALUE)
-        request_data.extend(nbytes.to_bytes(1, "little"))
+        if not 0 <= nbytes <= 255:
+            raise ValueError("Number of random bytes must be in range 0-255")
+
+        request_data = bytes((CMD_ID_RANDOM_VALUE, nbytes))
 
         result = self._call_command(request_data)
 
@@ -382,11 +494,7 @@ class TropicSquare:
         self._validate_config_address(address)
         value_bytes = self._config_value_to_bytes(value)
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_R_CFG_WRITE)
-        request_data.extend(address.to_bytes(CFG_ADDRESS_SIZE, "little"))
-        request_data.extend(b'M')  # Padding dummy data
-        request_data.extend(value_bytes)
+        request_data = struct.pack(_REQ_SLOT_PADDED, CMD_ID_R_CFG_WRITE, address, _PAD_M) + value_bytes
         self._call_command(request_data)
         return True
 
@@ -408,10 +516,7 @@ class TropicSquare:
         if not 0 <= bit_index <= 31:
             raise ValueError("I-CONFIG bit index must be in range 0-31")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_I_CFG_WRITE)
-        request_data.extend(address.to_bytes(CFG_ADDRESS_SIZE, "little"))
-        request_data.append(bit_index)
+        request_data = struct.pack(_REQ_SLOT_BYTE, CMD_ID_I_CFG_WRITE, address, bit_index)
         self._call_command(request_data)
 
         return True
@@ -423,9 +528,7 @@ class TropicSquare:
             :returns: True if erase succeeded
             :rtype: bool
         """
-        request_data = bytearray()
-        request_data.append(CMD_ID_R_CFG_ERASE)
-        self._call_command(request_data)
+        self._call_command(_REQ_R_CFG_ERASE)
         return True
 
 
@@ -433,9 +536,7 @@ class TropicSquare:
         """Read raw 4-byte config value payload for a single CO."""
         self._validate_config_address(address)
 
-        request_data = bytearray()
-        request_data.append(cmd_id)
-        request_data.extend(address.to_bytes(CFG_ADDRESS_SIZE, "little"))
+        request_data = struct.pack(_REQ_SLOT, cmd_id, address)
         result = self._call_command(request_data)
         return result[3:]
 
@@ -462,6 +563,16 @@ class TropicSquare:
             raise ValueError("Config address must be 16-bit (0x0000-0xFFFF)")
 
 
+    def _validate_slot(self, slot: int) -> None:
+        """Validate memory slot fits into its little-endian request field.
+
+            struct.pack would raise struct.error on CPython and silently
+            truncate on MicroPython, addressing another slot.
+        """
+        if not 0 <= slot <= _SLOT_MAX:
+            raise ValueError(f"Slot must be in range 0-{_SLOT_MAX}")
+
+
     def mem_data_read(self, slot : int) -> bytes:
         """Read data from memory slot
 
@@ -470,9 +581,9 @@ class TropicSquare:
             :returns: Data from memory slot
             :rtype: bytes
         """
-        request_data = bytearray()
-        request_data.append(CMD_ID_R_MEMDATA_READ)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
+        self._validate_slot(slot)
+
+        request_data = struct.pack(_REQ_SLOT, CMD_ID_R_MEMDATA_READ, slot)
 
         result = self._call_command(request_data)
 
@@ -490,14 +601,12 @@ class TropicSquare:
 
             :raises ValueError: If data size is larger than 444
         """
+        self._validate_slot(slot)
+
         if len(data) > MEM_DATA_MAX_SIZE:
             raise ValueError(f"Data size ({len(data)} bytes) exceeds maximum allowed size ({MEM_DATA_MAX_SIZE} bytes)")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_R_MEMDATA_WRITE)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
-        request_data.extend(b'M') # Padding dummy data
-        request_data.extend(data)
+        request_data = struct.pack(_REQ_SLOT_PADDED, CMD_ID_R_MEMDATA_WRITE, slot, _PAD_M) + data
 
         self._call_command(request_data)
 
@@ -512,9 +621,9 @@ class TropicSquare:
             :returns: True if data was erased
             :rtype: bool
         """
-        request_data = bytearray()
-        request_data.append(CMD_ID_R_MEMDATA_ERASE)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
+        self._validate_slot(slot)
+
+        request_data = struct.pack(_REQ_SLOT, CMD_ID_R_MEMDATA_ERASE, slot)
 
         self._call_command(request_data)
 
@@ -532,17 +641,14 @@ class TropicSquare:
 
             :raises ValueError: If slot is larger than ECC_MAX_KEYS or curve is invalid
         """
-        if slot > ECC_MAX_KEYS:
+        if not 0 <= slot <= ECC_MAX_KEYS:
             raise ValueError("Slot is larger than ECC_MAX_KEYS")
 
-        if curve not in [ECC_CURVE_P256, ECC_CURVE_ED25519]:
+        if curve not in _ECC_CURVES:
             raise ValueError("Invalid curve")
 
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_ECC_KEY_GENERATE)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
-        request_data.append(curve)
+        request_data = struct.pack(_REQ_SLOT_BYTE, CMD_ID_ECC_KEY_GENERATE, slot, curve)
 
         self._call_command(request_data)
 
@@ -561,18 +667,13 @@ class TropicSquare:
 
             :raises ValueError: If slot is larger than ECC_MAX_KEYS or curve is invalid
         """
-        if slot > ECC_MAX_KEYS:
+        if not 0 <= slot <= ECC_MAX_KEYS:
             raise ValueError("Slot is larger than ECC_MAX_KEYS")
 
-        if curve not in [ECC_CURVE_P256, ECC_CURVE_ED25519]:
+        if curve not in _ECC_CURVES:
             raise ValueError("Invalid curve")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_ECC_KEY_STORE)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
-        request_data.append(curve)
-        request_data.extend(b'\x00'*12) # Padding dummy data (maybe do random?)
-        request_data.extend(key)
+        request_data = struct.pack(_REQ_ECC_KEY_STORE, CMD_ID_ECC_KEY_STORE, slot, curve, _PAD_12) + key
 
         self._call_command(request_data)
 
@@ -596,12 +697,10 @@ class TropicSquare:
                     print("Ed25519 key")
                 print(key_info.public_key.hex())
         """
-        if slot > ECC_MAX_KEYS:
+        if not 0 <= slot <= ECC_MAX_KEYS:
             raise ValueError("Slot is larger than ECC_MAX_KEYS")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_ECC_KEY_READ)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
+        request_data = struct.pack(_REQ_SLOT, CMD_ID_ECC_KEY_READ, slot)
 
         result = self._call_command(request_data)
 
@@ -622,12 +721,10 @@ class TropicSquare:
 
             :raises ValueError: If slot is larger than ECC_MAX_KEYS
         """
-        if slot > ECC_MAX_KEYS:
+        if not 0 <= slot <= ECC_MAX_KEYS:
             raise ValueError("Slot is larger than ECC_MAX_KEYS")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_ECC_KEY_ERASE)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
+        request_data = struct.pack(_REQ_SLOT, CMD_ID_ECC_KEY_ERASE, slot)
 
         self._call_command(request_data)
 
@@ -653,14 +750,10 @@ class TropicSquare:
                 print(signature.r.hex())
                 print(signature.s.hex())
         """
-        if slot > ECC_MAX_KEYS:
+        if not 0 <= slot <= ECC_MAX_KEYS:
             raise ValueError("Slot is larger than ECC_MAX_KEYS")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_ECDSA_SIGN)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
-        request_data.extend(b'\x00'*13) # Padding dummy data (maybe do random?)
-        request_data.extend(hash)
+        request_data = struct.pack(_REQ_SIGN, CMD_ID_ECDSA_SIGN, slot, _PAD_13) + hash
 
         result = self._call_command(request_data)
 
@@ -685,14 +778,10 @@ class TropicSquare:
                 print(signature.r.hex())
                 print(signature.s.hex())
         """
-        if slot > ECC_MAX_KEYS:
+        if not 0 <= slot <= ECC_MAX_KEYS:
             raise ValueError("Slot is larger than ECC_MAX_KEYS")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_EDDSA_SIGN)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
-        request_data.extend(b'\x00'*13) # Padding dummy data (maybe do random?)
-        request_data.extend(message)
+        request_data = struct.pack(_REQ_SIGN, CMD_ID_EDDSA_SIGN, slot, _PAD_13) + message
 
         result = self._call_command(request_data)
 
@@ -710,15 +799,19 @@ class TropicSquare:
 
             :returns: True if counter was initialized
             :rtype: bool
+
+            :raises ValueError: If index or value is out of range
         """
+        if index < 0:
+            raise ValueError("Index must not be negative")
+
         if index > MCOUNTER_MAX:
             raise ValueError("Index is larger than MCOUNTER_MAX")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_MCOUNTER_INIT)
-        request_data.extend(index.to_bytes(2, "little"))
-        request_data.extend(b'A') # Padding dummy data
-        request_data.extend(value.to_bytes(4, "little"))
+        if not 0 <= value <= 0xFFFFFFFF:
+            raise ValueError("Counter value must be 32-bit unsigned integer")
+
+        request_data = struct.pack(_REQ_MCOUNTER_INIT, CMD_ID_MCOUNTER_INIT, index, _PAD_A, value)
 
         self._call_command(request_data)
 
@@ -733,12 +826,13 @@ class TropicSquare:
             :returns: True if counter was updated
             :rtype: bool
         """
+        if index < 0:
+            raise ValueError("Index must not be negative")
+
         if index > MCOUNTER_MAX:
             raise ValueError("Index is larger than MCOUNTER_MAX")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_MCOUNTER_UPDATE)
-        request_data.extend(index.to_bytes(2, "little"))
+        request_data = struct.pack(_REQ_SLOT, CMD_ID_MCOUNTER_UPDATE, index)
 
         self._call_command(request_data)
 
@@ -753,12 +847,13 @@ class TropicSquare:
             :returns: Counter value
             :rtype: int
         """
+        if index < 0:
+            raise ValueError("Index must not be negative")
+
         if index > MCOUNTER_MAX:
             raise ValueError("Index is larger than MCOUNTER_MAX")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_MCOUNTER_GET)
-        request_data.extend(index.to_bytes(2, "little"))
+        request_data = struct.pack(_REQ_SLOT, CMD_ID_MCOUNTER_GET, index)
 
         result = self._call_command(request_data)
 
@@ -803,7 +898,7 @@ class TropicSquare:
             mac_result = ts.mac_and_destroy(0, pin_data)
             print(f"MAC: {mac_result.hex()}")  # Returns 32-byte MAC
         """
-        if slot > MAC_AND_DESTROY_MAX:
+        if not 0 <= slot <= MAC_AND_DESTROY_MAX:
             raise ValueError(f"Slot {slot} exceeds maximum MAC_AND_DESTROY_MAX ({MAC_AND_DESTROY_MAX})")
 
         # Validate data length - must be exactly 32 bytes per API specification
@@ -813,11 +908,7 @@ class TropicSquare:
                 f"(got {len(data)} bytes). See TROPIC01 User API Table 37."
             )
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_MAC_AND_DESTROY)
-        request_data.extend(slot.to_bytes(MEM_ADDRESS_SIZE, "little"))
-        request_data.extend(b'M') # Padding dummy data
-        request_data.extend(data)
+        request_data = struct.pack(_REQ_SLOT_PADDED, CMD_ID_MAC_AND_DESTROY, slot, _PAD_M) + data
 
         result = self._call_command(request_data)
 
@@ -839,9 +930,7 @@ class TropicSquare:
                 f"Pairing key slot must be in range 0-{PAIRING_KEY_MAX}, got {slot}"
             )
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_PAIRING_KEY_READ)
-        request_data.extend(slot.to_bytes(PAIRING_ADDRESS_SIZE, "little"))
+        request_data = struct.pack(_REQ_SLOT, CMD_ID_PAIRING_KEY_READ, slot)
         result = self._call_command(request_data)
 
         return result[3:]
@@ -866,11 +955,7 @@ class TropicSquare:
         if len(key) != PAIRING_KEY_SIZE:
             raise ValueError(f"Key must be exactly {PAIRING_KEY_SIZE} bytes")
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_PAIRING_KEY_WRITE)
-        request_data.extend(slot.to_bytes(PAIRING_ADDRESS_SIZE, "little"))
-        request_data.extend(b'M') # Padding dummy data
-        request_data.extend(key)
+        request_data = struct.pack(_REQ_SLOT_PADDED, CMD_ID_PAIRING_KEY_WRITE, slot, _PAD_M) + key
 
         result = self._call_command(request_data)
 
@@ -892,9 +977,7 @@ class TropicSquare:
                 f"Pairing key slot must be in range 0-{PAIRING_KEY_MAX}, got {slot}"
             )
 
-        request_data = bytearray()
-        request_data.append(CMD_ID_PAIRING_KEY_INVALIDATE)
-        request_data.extend(slot.to_bytes(PAIRING_ADDRESS_SIZE, "little"))
+        request_data = struct.pack(_REQ_SLOT, CMD_ID_PAIRING_KEY_INVALIDATE, slot)
 
         self._call_command(request_data)
 
@@ -904,17 +987,25 @@ class TropicSquare:
         if self._secure_session is None:
             raise TropicSquareNoSession("Secure session not started")
 
-        nonce = self._secure_session[2].to_bytes(12, "little")
+        session = self._secure_session
+        nonce = session.nonce
         data = bytes(data)
 
-        enc = self._secure_session[0].encrypt(nonce=nonce, data=data, associated_data=b'')
+        # Views only, L2 copies them into the request buffer
+        enc = memoryview(session.enc.encrypt(nonce=nonce, data=data, associated_data=b''))
         ciphertext = enc[:-16]
         tag = enc[-16:]
 
         result_cipher, result_tag = self._l2.encrypted_command(len(ciphertext), ciphertext, tag)
-        decrypted = self._secure_session[1].decrypt(nonce=nonce, data=result_cipher+result_tag, associated_data=b'')
 
-        self._secure_session[2] += 1
+        # Join response ciphertext and tag with a single copy
+        cipher_len = len(result_cipher)
+        result = bytearray(cipher_len + len(result_tag))
+        result[:cipher_len] = result_cipher
+        result[cipher_len:] = result_tag
+        decrypted = session.dec.decrypt(nonce=nonce, data=result, associated_data=b'')
+
+        _increment_nonce(nonce)
 
         raise_for_cmd_result(decrypted[0])
 
@@ -922,16 +1013,45 @@ class TropicSquare:
 
 
     def _get_ephemeral_keypair(self):
+        """Generate ephemeral X25519 keypair
+
+            Private key must be returned as bytearray, so it can be wiped
+            after handshake.
+
+            :returns: (private_key, public_key)
+        """
         raise NotImplementedError("Not implemented")
 
 
     def _hkdf(self, salt, shared_secret, length=1):
+        """Derive 32 byte keys with HKDF-SHA256
+
+            Keys must be returned as bytearray, so they can be wiped
+            after handshake.
+
+            :returns: Single key if length is 1, otherwise list of keys
+        """
         raise NotImplementedError("Not implemented")
 
 
     def _x25519_exchange(self, private_bytes, public_bytes):
+        """Compute X25519 shared secret
+
+            Shared secret must be returned as bytearray, so it can be
+            wiped after handshake.
+        """
         raise NotImplementedError("Not implemented")
 
 
     def _aesgcm(self, key):
+        """Create AES-GCM cipher for given key
+
+            Returned object is kept for whole secure session and its
+            encrypt/decrypt are called for every L3 command, so key
+            expansion must be done here, once, and not on each call.
+            Key buffer is wiped after this call, the cipher must not keep
+            a reference to it.
+
+            :param key: AES-256 key
+        """
         raise NotImplementedError("Not implemented")
@@ -5,18 +5,50 @@ class CRC:
     CRC16_INITIAL_VAL = 0x0000
     CRC16_FINAL_XOR_VALUE = 0x0000
 
+    # Lookup tables filled in below the class, shared by all instances.
+    # Split to high and low bytes, so CRC can be kept as two byte values.
+    _CRC16_TABLE_HI = b''
+    _CRC16_TABLE_LO = b''
+
 
     @classmethod
     def crc16(cls, data: bytes) -> bytes:
         """Compute the CRC16 value for the given byte sequence."""
-        crc = cls.CRC16_INITIAL_VAL
+        return cls.crc16_final(cls.crc16_update(data))
+
+
+    @classmethod
+    def crc16_update(cls, data: bytes, crc: int = CRC16_INITIAL_VAL) -> int:
+        """Feed more data into a running CRC16 state.
+
+        Allows computing CRC over several buffers without joining them.
+        """
+        table_hi = cls._CRC16_TABLE_HI
+        table_lo = cls._CRC16_TABLE_LO
+        hi = crc >> 8
+        lo = crc & 0xFF
         for byte in data:
-            crc = cls._crc16_byte(byte, crc)
-        crc ^= cls.CRC16_FINAL_XOR_VALUE
+            index = hi ^ byte
+            hi = lo ^ table_hi[index]
+            lo = table_lo[index]
+        return (hi << 8) | lo
 
+
+    @classmethod
+    def crc16_final(cls, crc: int) -> bytes:
+        """Convert running CRC16 state to its two byte representation."""
+        crc ^= cls.CRC16_FINAL_XOR_VALUE
         return bytes([crc & 0xFF, (crc >> 8) & 0xFF])
 
 
+    @classmethod
+    def crc16_into(cls, buf: bytearray, offset: int, crc: int) -> None:
+        """Write running CRC16 state into buf at offset, little-endian."""
+        crc ^= cls.CRC16_FINAL_XOR_VALUE
+        buf[offset] = crc & 0xFF
+        buf[offset + 1] = (crc >> 8) & 0xFF
+
+
     @classmethod
     def _crc16_byte(cls, data: int, crc: int) -> int:
         """Process one byte of data into the CRC."""
@@ -28,3 +60,7 @@ class CRC:
                 crc <<= 1
             crc &= 0xFFFF
         return crc
+
+
+CRC._CRC16_TABLE_HI = bytes(CRC._crc16_byte(i, 0) >> 8 for i in range(256))
+CRC._CRC16_TABLE_LO = bytes(CRC._crc16_byte(i, 0) & 0xFF for i in range(256))
@@ -7,6 +7,10 @@ from tropicsquare.constants.cmd_result import *
 from tropicsquare.constants.rsp_status import *
 
 
+# Response statuses that do not indicate an error
+_VALID_RESPONSE_STATUSES = (RSP_STATUS_REQ_OK, RSP_STATUS_RES_OK, RSP_STATUS_RES_CONT, RSP_STATUS_REQ_CONT)
+
+
 def map_cmd_result_to_exception(cmd_result):
     """Map command result code to appropriate exception"""
     error_map = {
@@ -23,7 +27,7 @@ def map_cmd_result_to_exception(cmd_result):
     }
     
     exception_class, message = error_map.get(cmd_result, (TropicSquareCommandError, "Command failed"))
-    return exception_class(f"{message} (result: {hex(cmd_result)})", error_code=cmd_result)
+    return exception_class(f"{message} (result: {cmd_result:#x})", error_code=cmd_result)
 
 
 def map_response_status_to_exception(rsp_status):
@@ -40,7 +44,7 @@ def map_response_status_to_exception(rsp_status):
     }
     
     exception_class, message = error_map.get(rsp_status, (TropicSquareError, "Unknown response error"))
-    return exception_class(f"{message} (status: {hex(rsp_status)})", error_code=rsp_status)
+    return exception_class(f"{message} (status: {rsp_status:#x})", error_code=rsp_status)
 
 
 def raise_for_cmd_result(cmd_result):
@@ -51,6 +55,5 @@ def raise_for_cmd_result(cmd_result):
 
 def raise_for_response_status(rsp_status):
     """Raise exception if response status indicates error"""
-    valid_statuses = [RSP_STATUS_REQ_OK, RSP_STATUS_RES_OK, RSP_STATUS_RES_CONT, RSP_STATUS_REQ_CONT]
-    if rsp_status not in valid_statuses:
+    if rsp_status not in _VALID_RESPONSE_STATUSES:
         raise map_response_status_to_exception(rsp_status)
@@ -26,6 +26,23 @@ from tropicsquare.constants.get_info_req import GET_INFO_DATA_CHUNK_0_127
 from tropicsquare.exceptions import TropicSquareResponseError
 
 
+# Request ID prefixes as bytes, converted once from constant lists
+_REQ_GET_INFO = bytes(REQ_ID_GET_INFO_REQ)
+_REQ_HANDSHAKE = bytes(REQ_ID_HANDSHARE_REQ)
+_REQ_GET_LOG = bytes(REQ_ID_GET_LOG_REQ)
+_REQ_ENCRYPTED_CMD = bytes(REQ_ID_ENCRYPTED_CMD_REQ)
+_REQ_ENCRYPTED_SESSION_ABT = bytes(REQ_ID_ENCRYPTED_SESSION_ABT)
+_REQ_SLEEP = bytes(REQ_ID_SLEEP_REQ)
+_REQ_STARTUP = bytes(REQ_ID_STARTUP_REQ)
+
+# Maximum L3 data carried by one encrypted command request
+_CHUNK_SIZE = 128
+
+# Finished request frames for requests with a small, fixed set of payloads
+# (get info, get log, abort, sleep, startup), keyed by (req_id, payload)
+_REQUEST_CACHE = {}
+
+
 class L2Protocol:
     """L2 protocol layer implementation.
 
@@ -57,7 +74,7 @@ class L2Protocol:
             :raises TropicSquareError: If chip status is not ready
         """
         payload = bytes([object_id, req_data_chunk])
-        return self._send_and_get_response(REQ_ID_GET_INFO_REQ, payload)
+        return self._send_and_get_response(_REQ_GET_INFO, payload, cache=True)
 
 
     def handshake_req(self, ehpub: bytes, p_keyslot: int) -> tuple:
@@ -75,7 +92,7 @@ class L2Protocol:
             :raises TropicSquareError: If chip status is not ready
         """
         payload = ehpub + bytes([p_keyslot])
-        data = self._send_and_get_response(REQ_ID_HANDSHARE_REQ, payload)
+        data = self._send_and_get_response(_REQ_HANDSHAKE, payload)
 
         tsehpub = data[0:32]
         tsauth = data[32:48]
@@ -91,7 +108,7 @@ class L2Protocol:
 
             :raises TropicSquareError: If chip status is not ready
         """
-        return self._send_and_get_response(REQ_ID_GET_LOG_REQ)
+        return self._send_and_get_response(_REQ_GET_LOG, cache=True)
 
 
     def encrypted_command(self, command_size: int, command_ciphertext: bytes, command_tag: bytes) -> tuple:
@@ -110,23 +127,22 @@ class L2Protocol:
             :raises TropicSquareError: If chip status is not ready
             :raises TropicSquareResponseError: If response size mismatch
         """
-        def _chunk_data(data, chunk_size=128):
-            for i in range(0, len(data), chunk_size):
-                yield (data[i:i+chunk_size])
-
-        # L3 Data to chunk
-        l3data = bytearray()
-        l3data.extend(command_size.to_bytes(COMMAND_SIZE_LEN, "little"))
-        l3data.extend(command_ciphertext)
-        l3data.extend(command_tag)
-
-        # Send all chunks
-        for chunk in _chunk_data(l3data):
-            payload = bytes([len(chunk)]) + chunk
-            request = self._build_request(REQ_ID_ENCRYPTED_CMD_REQ, payload)
-            self._transport.send_request(request)
+        # L3 Data to chunk, allocated once at final size
+        tag_pos = COMMAND_SIZE_LEN + len(command_ciphertext)
+        l3data = bytearray(tag_pos + len(command_tag))
+        l3data[:COMMAND_SIZE_LEN] = command_size.to_bytes(COMMAND_SIZE_LEN, "little")
+        l3data[COMMAND_SIZE_LEN:tag_pos] = command_ciphertext
+        l3data[tag_pos:] = command_tag
+
+        # Send all chunks as views into l3data, each is copied only once,
+        # straight into its request frame together with its length byte.
+        # Method lookup bound once for the loop
+        send_and_get_response = self._send_and_get_response
+        l3view = memoryview(l3data)
+        for offset in range(0, len(l3data), _CHUNK_SIZE):
+            chunk = l3view[offset:offset + _CHUNK_SIZE]
             # Get ACK response for this chunk
-            self._transport.get_response()
+            send_and_get_response(_REQ_ENCRYPTED_CMD, chunk, payload_len=True)
 
         # Get final response
         data = self._transport.get_response()
@@ -151,7 +167,7 @@ class L2Protocol:
 
             :raises TropicSquareError: If chip status is not ready
         """
-        self._send_and_get_response(REQ_ID_ENCRYPTED_SESSION_ABT)
+        self._send_and_get_response(_REQ_ENCRYPTED_SESSION_ABT, cache=True)
         return True
 
 
@@ -168,7 +184,7 @@ class L2Protocol:
         """
 
         payload = bytes([sleep_mode])
-        self._send_and_get_response(REQ_ID_SLEEP_REQ, payload)
+        self._send_and_get_response(_REQ_SLEEP, payload, cache=True)
         return True
 
 
@@ -185,29 +201,61 @@ class L2Protocol:
         """
 
         payload = bytes([startup_id])
-        self._send_and_get_response(REQ_ID_STARTUP_REQ, payload)
+        self._send_and_get_response(_REQ_STARTUP, payload, cache=True)
         return True
 
 
     # === Private helper methods for reducing code duplication ===
 
-    def _build_request(self, req_id, payload=b''):
+    def _build_request(self, req_id, payload=b'', payload_len=False):
         """Build request frame with CRC.
 
-            :param req_id: Request ID bytes (e.g., REQ_ID_GET_INFO_REQ)
+            :param req_id: Request ID bytes (e.g., _REQ_GET_INFO)
             :param payload: Optional payload bytes
+            :param payload_len: Insert payload length byte before payload
 
             :returns: Complete request with CRC
             :rtype: bytearray
         """
-        data = bytearray()
-        data.extend(bytes(req_id))
-        data.extend(payload)
-        data.extend(CRC.crc16(data))
+        # Allocate exact frame size once instead of growing it
+        id_len = len(req_id)
+        payload_pos = id_len + 1 if payload_len else id_len
+        crc_pos = payload_pos + len(payload)
+        data = bytearray(crc_pos + 2)
+        data[:id_len] = req_id
+        if payload_len:
+            data[id_len] = len(payload)
+        data[payload_pos:crc_pos] = payload
+        # CRC is folded over the pieces, not re-read from the frame
+        crc = CRC.crc16_update(req_id)
+        if payload_len:
+            crc = CRC.crc16_update((len(payload),), crc)
+        crc = CRC.crc16_update(payload, crc)
+        CRC.crc16_into(data, crc_pos, crc)
         return data
 
 
-    def _send_and_get_response(self, req_id, payload=b''):
+    def _cached_request(self, req_id, payload=b''):
+        """Return request frame with CRC, building it only once.
+
+            Only use for requests whose payload comes from a small fixed
+            set, the cache is never evicted.
+
+            :param req_id: Request ID bytes
+            :param payload: Optional payload bytes
+
+            :returns: Complete request with CRC
+            :rtype: bytes
+        """
+        key = (bytes(req_id), bytes(payload))
+        request = _REQUEST_CACHE.get(key)
+        if request is None:
+            request = bytes(self._build_request(req_id, payload))
+            _REQUEST_CACHE[key] = request
+        return request
+
+
+    def _send_and_get_response(self, req_id, payload=b'', cache=False, payload_len=False):
         """Build request, send it, check status, and get response.
 
         Convenience method that combines common pattern of:
@@ -217,12 +265,17 @@ class L2Protocol:
 
             :param req_id: Request ID bytes
             :param payload: Optional payload bytes
+            :param cache: Reuse previously built request frame
+            :param payload_len: Insert payload length byte before payload
 
             :returns: Response data from chip
             :rtype: bytes
 
             :raises TropicSquareError: If chip is not ready
         """
-        request = self._build_request(req_id, payload)
+        if cache:
+            request = self._cached_request(req_id, payload)
+        else:
+            request = self._build_request(req_id, payload, payload_len)
         self._transport.send_request(request)
         return self._transport.get_response()
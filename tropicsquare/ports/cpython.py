@@ -1,14 +1,14 @@
 
-from .. import TropicSquare
+import hmac
+from hashlib import sha256
+
+from .. import TropicSquare, _wipe
 
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat, PrivateFormat, NoEncryption
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-from cryptography.hazmat.primitives.kdf.hkdf import HKDF
-from cryptography.hazmat.primitives.hashes import SHA256
-
 
 class TropicSquareCPython(TropicSquare):
     def __init__(self, transport):
@@ -22,27 +22,36 @@ class TropicSquareCPython(TropicSquare):
     def _get_ephemeral_keypair(self):
         ehpriv = X25519PrivateKey.generate()
         ehpubraw = ehpriv.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
-        ehprivraw = ehpriv.private_bytes(Encoding.Raw, PrivateFormat.Raw, NoEncryption())
+        # Mutable, so it can be wiped after handshake
+        ehprivraw = bytearray(ehpriv.private_bytes(Encoding.Raw, PrivateFormat.Raw, NoEncryption()))
 
         return (ehprivraw, ehpubraw)
 
 
     def _hkdf(self, salt, shared_secret, length = 1):
-        result = HKDF(algorithm=SHA256(),
-                    length=length * 32,
-                    salt=salt,
-                    info=None).derive(shared_secret)
+        # HKDF-SHA256 with empty info, each output block is one HMAC.
+        # Output blocks are mutable, so they can be wiped after handshake
+        prk = bytearray(hmac.new(salt, shared_secret, sha256).digest())
+
+        result = []
+        block = b''
+        for i in range(1, length + 1):
+            block = bytearray(hmac.new(prk, block + bytes((i,)), sha256).digest())
+            result.append(block)
+
+        _wipe(prk)
 
         if length > 1:
-            return [result[i*32:(i+1)*32] for i in range(length)]
-        else:
             return result
+        else:
+            return result[0]
 
 
     def _x25519_exchange(self, private_bytes, public_bytes):
         priv = X25519PrivateKey.from_private_bytes(private_bytes)
-        return priv.exchange(X25519PublicKey.from_public_bytes(bytes(public_bytes)))
+        return bytearray(priv.exchange(X25519PublicKey.from_public_bytes(bytes(public_bytes))))
 
 
     def _aesgcm(self, key):
-        return AESGCM(key)
+        # Cipher gets its own copy, caller wipes the key buffer afterwards
+        return AESGCM(bytes(key))
@@ -17,24 +17,27 @@ class TropicSquareMicroPython(TropicSquare):
 
 
     def _get_ephemeral_keypair(self):
-        ehpriv = b''
-        for _ in range(8):
-            ehpriv += getrandbits(32).to_bytes(4, "big")
+        # Mutable, so it can be wiped after handshake
+        ehpriv = bytearray(32)
+        for i in range(0, 32, 4):
+            ehpriv[i:i+4] = getrandbits(32).to_bytes(4, "big")
 
         return (ehpriv, X25519.pubkey(ehpriv))
 
 
     def _hkdf(self, salt, shared_secret, length = 1):
+        # Output blocks are mutable, so they can be wiped after handshake
         result = HKDF.derive(salt, shared_secret, length * 32)
         if length > 1:
-            return [result[i*32:(i+1)*32] for i in range(length)]
+            return [bytearray(result[i*32:(i+1)*32]) for i in range(length)]
         else:
-            return result
+            return bytearray(result)
 
 
     def _x25519_exchange(self, private_bytes, public_bytes):
-        return X25519.exchange(private_bytes, public_bytes)
+        return bytearray(X25519.exchange(private_bytes, public_bytes))
 
 
     def _aesgcm(self, key):
-        return AESGCM(key)
+        # Cipher gets its own copy, caller wipes the key buffer afterwards
+        return AESGCM(bytes(key))
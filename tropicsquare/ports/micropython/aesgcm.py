@@ -5,6 +5,11 @@ class AESGCM:
         self.key = key
         self._aes = ucryptolib.aes(key, 1)  # ECB mode
         self.H = self._encrypt_block(b'\x00' * 16)
+        # Multiples of H for every bit position, GHASH key is fixed for
+        # the lifetime of the cipher so they are computed only once.
+        # Costs 128 ints of 128 bits, roughly 5 KB of heap per cipher
+        # and a secure session holds two of them
+        self._H_table = self._gf_mult_table(int.from_bytes(self.H, "big"))
 
 
     def encrypt(self, nonce, data, associated_data):
@@ -54,22 +59,31 @@ class AESGCM:
         return self._aes.encrypt(block)
 
 
-    def _gf_mult(self, X, Y):
+    def _gf_mult_table(self, Y):
         R = 0xe1000000000000000000000000000000
-        Z = 0
+        table = []
         V = Y
-        for i in range(128):
-            if (X >> (127 - i)) & 1:
-                Z ^= V
+        for _ in range(128):
+            table.append(V)
             if V & 1:
                 V = (V >> 1) ^ R
             else:
                 V >>= 1
+        return table
+
+
+    def _gf_mult(self, X):
+        # Multiply X by H using precomputed table, MSB of X first
+        Z = 0
+        bit = 1 << 127
+        for V in self._H_table:
+            if X & bit:
+                Z ^= V
+            bit >>= 1
         return Z
 
 
     def _ghash(self, aad, ciphertext):
-        H_int = int.from_bytes(self.H, "big")
         X = 0
 
         # Process AAD
@@ -77,20 +91,20 @@ class AESGCM:
             block = aad[i:i+16]
             if len(block) < 16:
                 block += b'\x00' * (16 - len(block))
-            X = self._gf_mult(X ^ int.from_bytes(block, "big"), H_int)
+            X = self._gf_mult(X ^ int.from_bytes(block, "big"))
 
         # Process ciphertext
         for i in range(0, len(ciphertext), 16):
             block = ciphertext[i:i+16]
             if len(block) < 16:
                 block += b'\x00' * (16 - len(block))
-            X = self._gf_mult(X ^ int.from_bytes(block, "big"), H_int)
+            X = self._gf_mult(X ^ int.from_bytes(block, "big"))
 
         # Process length block: 64-bit lengths of AAD and ciphertext (in bits)
         aad_bits = len(aad) * 8
         ct_bits = len(ciphertext) * 8
         L = aad_bits.to_bytes(8, "big") + ct_bits.to_bytes(8, "big")
-        X = self._gf_mult(X ^ int.from_bytes(L, "big"), H_int)
+        X = self._gf_mult(X ^ int.from_bytes(L, "big"))
 
         return X.to_bytes(16, "big")
 
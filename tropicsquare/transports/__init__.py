@@ -13,6 +13,19 @@ from tropicsquare.crc import CRC
 from tropicsquare.error_mapping import raise_for_response_status
 
 
+# Get response request frame, same for every poll
+_GET_RESPONSE_REQUEST = bytes(REQ_ID_GET_RESPONSE)
+
+# Chip statuses on which get_response waits and polls again
+_CHIP_STATUS_RETRY = (CHIP_STATUS_NOT_READY, CHIP_STATUS_BUSY)
+
+# Busy chip is polled with exponential backoff (seconds), total wait is kept
+# the same as MAX_RETRIES polls with the longest delay
+_RETRY_DELAY_MIN = 0.001
+_RETRY_DELAY_MAX = 0.025
+_RETRY_BUDGET = MAX_RETRIES * _RETRY_DELAY_MAX
+
+
 class L1Transport():
     """Base class for L1 transport layer.
 
@@ -37,6 +50,9 @@ class L1Transport():
     def get_response(self) -> bytes:
         """Get response from chip with automatic retry logic.
 
+        Responses split by the chip into several continuation chunks are
+        joined together.
+
         :returns: Response data from chip
         :rtype: bytes
         :raises TropicSquareAlarmError: If chip is in alarm state
@@ -45,19 +61,41 @@ class L1Transport():
         :raises TropicSquareError: On other communication errors
         """
 
-        chip_status = CHIP_STATUS_NOT_READY
+        response_status, data = self._get_response_chunk()
+        if response_status != RSP_STATUS_RES_CONT:
+            return data
 
-        for _ in range(MAX_RETRIES):
-            data = bytearray()
-            data.extend(bytes(REQ_ID_GET_RESPONSE))
+        parts = [data]
+        while response_status == RSP_STATUS_RES_CONT:
+            response_status, data = self._get_response_chunk()
+            parts.append(data)
 
+        return b''.join(part for part in parts if part)
+
+
+    def _get_response_chunk(self) -> tuple:
+        """Get one response chunk from chip with automatic retry logic.
+
+        :returns: (response_status, data), data is None for empty chunk
+        :rtype: tuple
+        :raises TropicSquareAlarmError: If chip is in alarm state
+        :raises TropicSquareCRCError: If CRC validation fails
+        :raises TropicSquareTimeoutError: If chip remains busy after max retries
+        :raises TropicSquareError: On other communication errors
+        """
+
+        delay = _RETRY_DELAY_MIN
+        waited = 0.0
+
+        while waited < _RETRY_BUDGET:
             self._cs_low()
-            data[:] = self._transfer(data)
-            chip_status = data[0]
+            chip_status = self._transfer(_GET_RESPONSE_REQUEST)[0]
 
-            if chip_status in [CHIP_STATUS_NOT_READY, CHIP_STATUS_BUSY]:
+            if chip_status in _CHIP_STATUS_RETRY:
                 self._cs_high()
-                sleep(0.025)
+                sleep(delay)
+                waited += delay
+                delay = min(delay * 2, _RETRY_DELAY_MAX)
                 continue
 
             if chip_status & CHIP_STATUS_ALARM:
@@ -71,30 +109,42 @@ class L1Transport():
 
             if response_status == CHIP_STATUS_BUSY:
                 self._cs_high()
-                sleep(0.025)
+                sleep(delay)
+                waited += delay
+                delay = min(delay * 2, _RETRY_DELAY_MAX)
                 continue
 
+            # Read data and CRC in one go
+            tail = self._read(response_length + 2)
             if response_length > 0:
-                data = self._read(response_length)
+                data = tail[:response_length]
             else:
                 data = None
 
-            calccrc = CRC.crc16(response + (data or b''))
-            respcrc = self._read(2)
+            crc = CRC.crc16_update(response)
+            if data:
+                crc = CRC.crc16_update(data, crc)
 
             self._cs_high()
 
             raise_for_response_status(response_status)
 
-            if respcrc != calccrc:
+            if len(tail) < response_length + 2:
                 raise TropicSquareCRCError(
-                    f"CRC mismatch ({calccrc.hex()}<!=>{respcrc.hex()})"
+                    f"CRC mismatch (short read: {len(tail)} of {response_length + 2} bytes)"
                 )
 
-            if response_status == RSP_STATUS_RES_CONT:
-                data += self.get_response()
+            # CRC is sent little-endian, compare as integers and format
+            # bytes only for the error message
+            crc ^= CRC.CRC16_FINAL_XOR_VALUE
+            if crc != tail[response_length] | (tail[response_length + 1] << 8):
+                calccrc = bytes((crc & 0xFF, crc >> 8))
+                respcrc = bytes(tail[response_length:])
+                raise TropicSquareCRCError(
+                    f"CRC mismatch ({calccrc.hex()}<!=>{respcrc.hex()})"
+                )
 
-            return data
+            return (response_status, data)
 
         raise TropicSquareTimeoutError("Chip communication timeout - chip remains busy")
 
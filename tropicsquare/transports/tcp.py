@@ -164,12 +164,22 @@ class TcpTransport(L1Transport):
         Corresponds to SPI read operation.
         Sends dummy bytes (all zeros) and reads response.
 
+        Reads longer than MAX_PAYLOAD_LEN (255 byte response with its CRC)
+        are split into several messages while chip select stays low.
+
         :param length: Number of bytes to read
 
         :returns: Read data
         """
         # Send dummy bytes (all zeros) to clock out data
-        return self._communicate(self.TAG_SPI_SEND, bytes(length))
+        if length <= self.MAX_PAYLOAD_LEN:
+            return self._communicate(self.TAG_SPI_SEND, bytes(length))
+
+        parts = []
+        for offset in range(0, length, self.MAX_PAYLOAD_LEN):
+            part_len = min(self.MAX_PAYLOAD_LEN, length - offset)
+            parts.append(self._communicate(self.TAG_SPI_SEND, bytes(part_len)))
+        return b''.join(parts)
 
 
     def _cs_low(self) -> None: